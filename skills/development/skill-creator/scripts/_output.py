@@ -0,0 +1,34 @@
+"""
+Console output shared by skill-creator scripts
+
+typer and rich are only imported by the CLI entry points, which call
+use_rich(). When a script is imported as a library, log() falls back to
+print() with Rich markup stripped, so importing validate or package_skill
+does not pull in Rich's rendering stack.
+"""
+
+import re
+from typing import Any, Optional
+
+_MARKUP_RE = re.compile(r"\[/?[a-z][a-z ]*\]")
+_console: Optional[Any] = None
+
+
+def use_rich() -> None:
+    """Route log() through a Rich console (called by CLI entry points)"""
+    global _console
+    from rich.console import Console
+    _console = Console()
+
+
+def get_console() -> Optional[Any]:
+    """Return the Rich console, or None if use_rich() was not called"""
+    return _console
+
+
+def log(message: Any = "") -> None:
+    """Print a message through Rich when enabled, plain print() otherwise"""
+    if _console is not None:
+        _console.print(message)
+    else:
+        print(_MARKUP_RE.sub("", str(message)))
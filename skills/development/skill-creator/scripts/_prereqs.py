@@ -0,0 +1,37 @@
+"""
+Prerequisite checks shared by skill-creator scripts
+
+Each script passes the modules it actually imports. Lookups are memoized per
+module, so scripts that import each other (package_skill -> validate) reuse
+earlier results instead of repeating them.
+"""
+
+import importlib.util
+from functools import lru_cache
+from typing import Tuple
+
+
+# Import name -> pip package name, where they differ
+_PACKAGES = {"yaml": "pyyaml"}
+
+
+@lru_cache(maxsize=None)
+def _available(module: str) -> bool:
+    """Whether module can be imported (find_spec, so nothing is loaded)"""
+    return importlib.util.find_spec(module) is not None
+
+
+def check_prerequisites(*modules: str) -> Tuple[bool, str]:
+    """
+    Check if the given modules are installed
+    
+    Uses find_spec() rather than importing, so the check does not load
+    typer/rich for scripts that are only imported as libraries.
+    """
+    missing = [_PACKAGES.get(module, module) for module in modules if not _available(module)]
+    
+    if missing:
+        deps = " ".join(missing)
+        return False, f"Missing dependencies: {deps}\n💡 Install with: pip install {deps}"
+    
+    return True, "All dependencies available"
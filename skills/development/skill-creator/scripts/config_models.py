@@ -2,9 +2,13 @@
 Shared configuration models for skill-creator scripts
 
 Uses Pydantic for type-safe configuration and validation.
+Requires Python 3.11+ for the built-in tomllib parser.
 """
 
-from typing import Set, Optional
+import sys
+import tomllib
+from functools import cached_property, lru_cache
+from typing import FrozenSet, Optional
 from pathlib import Path
 from pydantic import BaseModel, Field, field_validator
 
@@ -35,15 +39,20 @@ class ValidationRules(BaseModel):
     max_description_length: int = Field(default=1024, le=10000)
     
     # Frontmatter rules
-    allowed_properties: Set[str] = Field(
-        default={"name", "description", "license", "allowed-tools", "metadata"}
+    allowed_properties: FrozenSet[str] = Field(
+        default=frozenset({"name", "description", "license", "allowed-tools", "metadata"})
     )
+    
+    @cached_property
+    def allowed_properties_display(self) -> str:
+        """Sorted, comma-separated allowed_properties for error messages"""
+        return ', '.join(sorted(self.allowed_properties))
 
 
 class PackagingConfig(BaseModel):
     """Packaging configuration"""
     output_dir: str = Field(default="dist", description="Output directory for .skill files")
-    compression_level: int = Field(default=9, ge=0, le=9, description="ZIP compression level")
+    compression_level: int = Field(default=6, ge=0, le=9, description="ZIP compression level")
     include_dotfiles: bool = Field(default=False, description="Include hidden files")
     exclude_patterns: list[str] = Field(
         default_factory=lambda: [".DS_Store", "__pycache__", "*.pyc", ".git", ".venv"]
@@ -81,6 +90,37 @@ class TemplatesConfig(BaseModel):
     )
 
 
+@lru_cache(maxsize=32)
+def load_template(template_root: Path, template_path: str) -> str:
+    """
+    Read a template file relative to template_root
+    
+    Memoized so repeated skill inits in one process reuse the contents.
+    Failed reads raise and are not cached.
+    """
+    return (template_root / template_path).read_bytes().decode()
+
+
+class TemplateCache:
+    """Template file contents, read from disk once at construction"""
+
+    def __init__(self, root: Path, cfg: TemplatesConfig):
+        self._cache: dict[str, str] = {}
+        self.errors: dict[str, str] = {}
+
+        for key, template_path in cfg.model_dump().items():
+            try:
+                self._cache[key] = load_template(root, template_path)
+            except FileNotFoundError:
+                self.errors[key] = f"Template not found: {root / template_path}"
+            except (OSError, UnicodeDecodeError) as e:
+                self.errors[key] = f"Could not load template {template_path}: {e}"
+
+    def get(self, key: str) -> str:
+        """Return template contents by config key, or "" if it failed to load"""
+        return self._cache.get(key, "")
+
+
 class SkillCreatorConfig(BaseModel):
     """Complete skill-creator configuration"""
     author: AuthorConfig = Field(default_factory=AuthorConfig)
@@ -94,17 +134,57 @@ class SkillCreatorConfig(BaseModel):
     def from_toml(cls, config_path: Path) -> "SkillCreatorConfig":
         """Load configuration from TOML file"""
         try:
-            try:
-                import tomllib
-            except ImportError:
-                import tomli as tomllib
-            
             with open(config_path, 'rb') as f:
                 toml_data = tomllib.load(f)
                 return cls(**toml_data)
         except Exception as e:
             print(f"⚠️  Warning: Could not load config.toml: {e}")
             return cls()  # Return default config
+    
+    @classmethod
+    def from_toml_fast(cls, config_path: Path) -> "SkillCreatorConfig":
+        """
+        Load configuration from TOML file without Pydantic validation
+        
+        Each section is built with model_construct(), which only fills in
+        defaults. Intended for the trusted config.toml read on every CLI run;
+        use from_toml() to check a config file for errors.
+        """
+        try:
+            with open(config_path, 'rb') as f:
+                toml_data = tomllib.load(f)
+            
+            sections = {
+                name: field.annotation.model_construct(**toml_data.get(name, {}))
+                for name, field in cls.model_fields.items()
+            }
+            config = cls.model_construct(**sections)
+            # TOML arrays arrive as lists; frozenset is the only coercion needed
+            config.validation.allowed_properties = frozenset(
+                sys.intern(p) for p in config.validation.allowed_properties
+            )
+            return config
+        except Exception as e:
+            print(f"⚠️  Warning: Could not load config.toml: {e}")
+            return cls()  # Return default config
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> SkillCreatorConfig:
+    """Parse config.toml once per (path, mtime) pair"""
+    return SkillCreatorConfig.from_toml_fast(Path(config_path))
+
+
+def load_config_file(config_path: Path) -> SkillCreatorConfig:
+    """
+    Load configuration from a TOML file, reusing the parsed result
+
+    The cache is keyed on the resolved path and modification time, so repeat
+    loads in one process (e.g. package_skill -> validate_skill) skip parsing
+    while edits to the file are still picked up.
+    """
+    resolved = config_path.resolve()
+    return _load_config_cached(str(resolved), resolved.stat().st_mtime)
 
 
 class SkillMetadata(BaseModel):
@@ -7,92 +7,68 @@ Loads configuration from config.toml for customization.
 Uses Pydantic for type-safe configuration and Typer for modern CLI.
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional
 
 # ============================================================================
 # PREREQUISITE CHECKS
 # ============================================================================
 
-def check_prerequisites() -> Tuple[bool, str]:
-    """Check if all required dependencies are installed"""
-    missing = []
-    
-    try:
-        from pydantic import BaseModel
-    except ImportError:
-        missing.append("pydantic")
-    
-    try:
-        import typer
-    except ImportError:
-        missing.append("typer")
-    
-    try:
-        from rich.console import Console
-    except ImportError:
-        missing.append("rich")
-    
-    if missing:
-        deps = " ".join(missing)
-        return False, f"Missing dependencies: {deps}\n💡 Install with: pip install {deps}"
-    
-    return True, "All dependencies available"
+try:
+    from _prereqs import check_prerequisites
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _prereqs import check_prerequisites
 
+prereq_ok, prereq_msg = check_prerequisites("pydantic", "typer", "rich")
 
-# Check prerequisites first
-prereq_ok, prereq_msg = check_prerequisites()
 if not prereq_ok:
     print(f"❌ {prereq_msg}")
     sys.exit(1)
 
 # Now import the rest after prerequisite check
-try:
-    from config_models import SkillCreatorConfig
-    import typer
-    from rich.console import Console
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).parent))
-    from config_models import SkillCreatorConfig
-    import typer
-    from rich.console import Console
-
-from typing_extensions import Annotated
+from config_models import SkillCreatorConfig, TemplateCache, load_config_file
+from _output import log, use_rich
 
-console = Console()
-app = typer.Typer(help="🚀 Skill Initializer - Creates new skills from templates")
 
-
-def load_config() -> SkillCreatorConfig:
-    """Load configuration from config.toml using Pydantic"""
+def load_config(validate: bool = False) -> SkillCreatorConfig:
+    """Load configuration from config.toml (with full Pydantic validation if validate)"""
     script_dir = Path(__file__).parent
     config_path = script_dir.parent / "config.toml"
     
     if config_path.exists():
-        return SkillCreatorConfig.from_toml(config_path)
+        if validate:
+            return SkillCreatorConfig.from_toml(config_path)
+        return load_config_file(config_path)
     else:
-        console.print("⚠️  [yellow]Warning:[/yellow] config.toml not found, using defaults")
+        log("⚠️  [yellow]Warning:[/yellow] config.toml not found, using defaults")
         return SkillCreatorConfig()
 
 
-def load_template(template_path: str) -> str:
-    """Load a template file from disk"""
+def load_templates(config: SkillCreatorConfig) -> TemplateCache:
+    """Preload all template files, warning about any that could not be read"""
+    skill_creator_root = Path(__file__).parent.parent
+    templates = TemplateCache(skill_creator_root, config.templates)
+    for error in templates.errors.values():
+        log(f"⚠️  [yellow]Warning:[/yellow] {error}")
+    return templates
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a temporary sibling file, then atomically replace path"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
     try:
-        script_dir = Path(__file__).parent
-        skill_creator_root = script_dir.parent
-        full_path = skill_creator_root / template_path
-        
-        if full_path.exists():
-            return full_path.read_text()
-        else:
-            console.print(f"⚠️  [yellow]Warning:[/yellow] Template not found: {full_path}")
-            return ""
-    except Exception as e:
-        console.print(f"⚠️  [yellow]Warning:[/yellow] Could not load template {template_path}: {e}")
-        return ""
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
+@lru_cache(maxsize=128)
 def title_case_skill_name(skill_name: str) -> str:
     """Convert hyphenated skill name to Title Case for display"""
     return " ".join(word.capitalize() for word in skill_name.split("-"))
@@ -132,23 +108,26 @@ def init_skill(
 
     # Check if directory already exists
     if skill_dir.exists():
-        console.print(f"❌ [bold red]Error:[/bold red] Skill directory already exists: {skill_dir}")
+        log(f"❌ [bold red]Error:[/bold red] Skill directory already exists: {skill_dir}")
         return None
 
     # Create skill directory
     try:
         skill_dir.mkdir(parents=True, exist_ok=False)
-        console.print(f"✅ Created skill directory: {skill_dir}")
+        log(f"✅ Created skill directory: {skill_dir}")
     except Exception as e:
-        console.print(f"❌ [bold red]Error creating directory:[/bold red] {e}")
+        log(f"❌ [bold red]Error creating directory:[/bold red] {e}")
         return None
 
-    # Load and create SKILL.md from template
+    # Load all templates up front
+    templates = load_templates(config)
+
+    # Create SKILL.md from template
     skill_title = title_case_skill_name(skill_name)
-    skill_template_content = load_template(config.templates.skill_template)
+    skill_template_content = templates.get("skill_template")
     
     if not skill_template_content:
-        console.print("❌ [bold red]Error:[/bold red] Could not load SKILL.md template")
+        log("❌ [bold red]Error:[/bold red] Could not load SKILL.md template")
         return None
     
     skill_content = skill_template_content.format(
@@ -161,26 +140,26 @@ def init_skill(
 
     skill_md_path = skill_dir / "SKILL.md"
     try:
-        skill_md_path.write_text(skill_content)
-        console.print("✅ Created SKILL.md")
+        _atomic_write_bytes(skill_md_path, skill_content.encode('utf-8'))
+        log("✅ Created SKILL.md")
     except Exception as e:
-        console.print(f"❌ [bold red]Error creating SKILL.md:[/bold red] {e}")
+        log(f"❌ [bold red]Error creating SKILL.md:[/bold red] {e}")
         return None
 
-    # Load and create README.md from template
-    readme_template_content = load_template(config.templates.readme_template)
+    # Create README.md from template
+    readme_template_content = templates.get("readme_template")
     
     if not readme_template_content:
-        console.print("❌ [bold red]Error:[/bold red] Could not load README.md template")
+        log("❌ [bold red]Error:[/bold red] Could not load README.md template")
         return None
     
     readme_content = readme_template_content.format(skill_title=skill_title, skill_name=skill_name)
     readme_path = skill_dir / "README.md"
     try:
-        readme_path.write_text(readme_content)
-        console.print("✅ Created README.md")
+        _atomic_write_bytes(readme_path, readme_content.encode('utf-8'))
+        log("✅ Created README.md")
     except Exception as e:
-        console.print(f"❌ [bold red]Error creating README.md:[/bold red] {e}")
+        log(f"❌ [bold red]Error creating README.md:[/bold red] {e}")
         return None
 
     # Create resource directories based on config
@@ -189,94 +168,113 @@ def init_skill(
             scripts_dir = skill_dir / "scripts"
             scripts_dir.mkdir(exist_ok=True)
             
-            # Load and create example script
-            script_template = load_template(config.templates.example_script_template)
+            # Create example script
+            script_template = templates.get("example_script_template")
             if script_template:
                 example_script = scripts_dir / "example.py"
-                example_script.write_text(script_template.format(skill_name=skill_name))
+                _atomic_write_bytes(example_script, script_template.format(skill_name=skill_name).encode('utf-8'))
                 example_script.chmod(0o755)
-                console.print("✅ Created scripts/example.py")
+                log("✅ Created scripts/example.py")
 
         if config.directories.create_references:
             references_dir = skill_dir / "references"
             references_dir.mkdir(exist_ok=True)
             
-            # Load and create example reference
-            reference_template = load_template(config.templates.example_reference_template)
+            # Create example reference
+            reference_template = templates.get("example_reference_template")
             if reference_template:
                 example_reference = references_dir / "api_reference.md"
-                example_reference.write_text(reference_template.format(skill_title=skill_title))
-                console.print("✅ Created references/api_reference.md")
+                _atomic_write_bytes(example_reference, reference_template.format(skill_title=skill_title).encode('utf-8'))
+                log("✅ Created references/api_reference.md")
 
         if config.directories.create_assets:
             assets_dir = skill_dir / "assets"
             assets_dir.mkdir(exist_ok=True)
             
-            # Load and create example asset
-            asset_template = load_template(config.templates.example_asset_template)
+            # Create example asset
+            asset_template = templates.get("example_asset_template")
             if asset_template:
                 example_asset = assets_dir / "example_asset.txt"
-                example_asset.write_text(asset_template)
-                console.print("✅ Created assets/example_asset.txt")
+                _atomic_write_bytes(example_asset, asset_template.encode('utf-8'))
+                log("✅ Created assets/example_asset.txt")
                 
     except Exception as e:
-        console.print(f"❌ [bold red]Error creating resource directories:[/bold red] {e}")
+        log(f"❌ [bold red]Error creating resource directories:[/bold red] {e}")
         return None
 
-    # Print next steps
-    console.print(f"\n✅ [bold green]Skill '{skill_name}' initialized successfully[/bold green] at {skill_dir}")
-    console.print("\n📝 [bold]Generated files:[/bold]")
-    console.print("   • SKILL.md - Skill definition for AI agents")
-    console.print("   • README.md - Documentation for humans")
+    # Print next steps (as one batch)
+    lines = [
+        f"\n✅ [bold green]Skill '{skill_name}' initialized successfully[/bold green] at {skill_dir}",
+        "\n📝 [bold]Generated files:[/bold]",
+        "   • SKILL.md - Skill definition for AI agents",
+        "   • README.md - Documentation for humans",
+    ]
     if config.directories.create_scripts:
-        console.print("   • scripts/ - Example executable scripts")
+        lines.append("   • scripts/ - Example executable scripts")
     if config.directories.create_references:
-        console.print("   • references/ - Example reference documentation")
+        lines.append("   • references/ - Example reference documentation")
     if config.directories.create_assets:
-        console.print("   • assets/ - Example asset files")
-    console.print("\n[bold]Next steps:[/bold]")
-    console.print("1. Edit SKILL.md and README.md to complete the TODO items")
-    console.print("2. Customize or delete the example files in resource directories")
-    console.print("3. Run validate.py when ready to check the skill structure")
+        lines.append("   • assets/ - Example asset files")
+    lines += [
+        "\n[bold]Next steps:[/bold]",
+        "1. Edit SKILL.md and README.md to complete the TODO items",
+        "2. Customize or delete the example files in resource directories",
+        "3. Run validate.py when ready to check the skill structure",
+    ]
+    log("\n".join(lines))
 
     return skill_dir
 
 
-@app.command()
-def main(
-    skill_name: Annotated[str, typer.Argument(help="Name of the skill (hyphen-case, e.g., 'my-skill')")],
-    path: Annotated[Path, typer.Option("--path", "-p", help="Directory where skill should be created")] = Path("."),
-    category: Annotated[Optional[str], typer.Option("--category", "-c", help="Skill category")] = None,
-    author: Annotated[Optional[str], typer.Option("--author", "-a", help="Author name")] = None,
-):
-    """
-    Initialize a new skill with template files.
-    
-    Creates a skill directory with SKILL.md, README.md, and example resource files.
-    Configuration loaded from config.toml (or defaults if not found).
-    
-    Skill name requirements:
-     • Hyphen-case identifier (e.g., 'data-analyzer')
-     • Lowercase letters, digits, and hyphens only
-     • Max 64 characters
-    """
-    console.print(f"\n🚀 [bold cyan]Initializing skill:[/bold cyan] {skill_name}")
-    console.print(f"   Location: {path}")
-    if category:
-        console.print(f"   Category: {category}")
-    if author:
-        console.print(f"   Author: {author}")
-    console.print()
-
-    result = init_skill(skill_name, path, category, author)
-
-    if result:
-        console.print()
-        raise typer.Exit(0)
-    else:
-        console.print()
-        raise typer.Exit(1)
+def _cli() -> None:
+    """Build and run the Typer CLI (typer and rich are only imported here)"""
+    import typer
+    from typing_extensions import Annotated
+
+    use_rich()
+    app = typer.Typer(help="🚀 Skill Initializer - Creates new skills from templates")
+
+    @app.command()
+    def main(
+        skill_name: Annotated[str, typer.Argument(help="Name of the skill (hyphen-case, e.g., 'my-skill')")],
+        path: Annotated[Path, typer.Option("--path", "-p", help="Directory where skill should be created")] = Path("."),
+        category: Annotated[Optional[str], typer.Option("--category", "-c", help="Skill category")] = None,
+        author: Annotated[Optional[str], typer.Option("--author", "-a", help="Author name")] = None,
+        validate_config: Annotated[bool, typer.Option("--validate-config", help="Validate config.toml with Pydantic before use")] = False,
+    ):
+        """
+        Initialize a new skill with template files.
+
+        Creates a skill directory with SKILL.md, README.md, and example resource files.
+        Configuration loaded from config.toml (or defaults if not found).
+
+        Skill name requirements:
+         • Hyphen-case identifier (e.g., 'data-analyzer')
+         • Lowercase letters, digits, and hyphens only
+         • Max 64 characters
+        """
+        lines = [
+            f"\n🚀 [bold cyan]Initializing skill:[/bold cyan] {skill_name}",
+            f"   Location: {path}",
+        ]
+        if category:
+            lines.append(f"   Category: {category}")
+        if author:
+            lines.append(f"   Author: {author}")
+        log("\n".join(lines) + "\n")
+
+        config = load_config(validate=validate_config)
+        result = init_skill(skill_name, path, category, author, config)
+
+        if result:
+            log()
+            raise typer.Exit(0)
+        else:
+            log()
+            raise typer.Exit(1)
+
+    app()
 
 
 if __name__ == "__main__":
-    app()
+    _cli()
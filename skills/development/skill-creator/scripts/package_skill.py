@@ -5,70 +5,38 @@ Validates skill structure and packages into a ZIP archive for distribution.
 Uses Pydantic for type-safe configuration and Typer for modern CLI.
 """
 
+import os
+import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
-from typing import List, Optional, Tuple
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
+from typing import Iterator, List, Optional, Tuple
 import fnmatch
 
 # ============================================================================
 # PREREQUISITE CHECKS
 # ============================================================================
 
-def check_prerequisites() -> Tuple[bool, str]:
-    """Check if all required dependencies are installed"""
-    missing = []
-    
-    try:
-        from pydantic import BaseModel
-    except ImportError:
-        missing.append("pydantic")
-    
-    try:
-        import typer
-    except ImportError:
-        missing.append("typer")
-    
-    try:
-        from rich.console import Console
-    except ImportError:
-        missing.append("rich")
-    
-    if missing:
-        deps = " ".join(missing)
-        return False, f"Missing dependencies: {deps}\n💡 Install with: pip install {deps}"
-    
-    return True, "All dependencies available"
+try:
+    from _prereqs import check_prerequisites
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _prereqs import check_prerequisites
 
+prereq_ok, prereq_msg = check_prerequisites("pydantic", "typer", "rich")
 
-# Check prerequisites first
-prereq_ok, prereq_msg = check_prerequisites()
 if not prereq_ok:
     print(f"❌ {prereq_msg}")
     sys.exit(1)
 
 # Now import the rest after prerequisite check
-try:
-    from config_models import SkillCreatorConfig
-    import typer
-    from rich.console import Console
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).parent))
-    from config_models import SkillCreatorConfig
-    import typer
-    from rich.console import Console
+from config_models import SkillCreatorConfig, load_config_file
+from _output import log, use_rich
 
 # Import validate module
-try:
-    from validate import validate_skill
-except ImportError:
-    sys.path.insert(0, str(Path(__file__).parent))
-    from validate import validate_skill
-
-from typing_extensions import Annotated
-
-console = Console()
-app = typer.Typer(help="📦 Skill Packager - Creates distributable .skill files")
+from validate import validate_skill
 
 
 def load_config() -> SkillCreatorConfig:
@@ -77,36 +45,94 @@ def load_config() -> SkillCreatorConfig:
     config_path = script_dir.parent / "config.toml"
     
     if config_path.exists():
-        return SkillCreatorConfig.from_toml(config_path)
+        return load_config_file(config_path)
     else:
-        console.print("⚠️  [yellow]Warning:[/yellow] config.toml not found, using defaults")
+        log("⚠️  [yellow]Warning:[/yellow] config.toml not found, using defaults")
         return SkillCreatorConfig()
 
 
-def should_exclude(file_path: Path, base_path: Path, patterns: List[str], include_dotfiles: bool = False) -> bool:
-    """Check if file should be excluded from packaging"""
-    relative_path = file_path.relative_to(base_path)
-    
-    # Exclude dotfiles unless explicitly included
-    if not include_dotfiles:
-        for part in relative_path.parts:
-            if part.startswith('.'):
-                return True
-    
-    # Check against exclusion patterns
-    path_str = str(relative_path)
-    for pattern in patterns:
-        if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-            return True
-    
-    return False
+def compile_patterns(patterns: List[str]) -> re.Pattern:
+    """
+    Combine fnmatch-style exclusion patterns into one compiled regex
+
+    fnmatch.translate() anchors each pattern with \\Z, so the alternation
+    still requires a full match. An empty pattern list never matches.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns))
+
+
+def should_exclude(relative_path: str, name: str, pattern: re.Pattern) -> bool:
+    """Check if a file or directory matches the exclusion pattern (by relative path or name)"""
+    return bool(pattern.match(relative_path) or pattern.match(name))
+
+
+def collect_files(skill_path: Path, patterns: List[str], include_dotfiles: bool = False) -> List[str]:
+    """
+    Collect files to package using a single os.scandir walk
+
+    Dotfile directories (unless include_dotfiles is set) and directories
+    matching an exclusion pattern (e.g. __pycache__) are pruned without
+    descending into them, so trees like .git or .venv are never walked.
+
+    Returns:
+        Paths of files to package, relative to skill_path
+    """
+    base = os.fspath(skill_path)
+    prefix_len = len(base) + 1
+    exclude_re = compile_patterns(patterns)
+
+    def _walk(directory: str) -> Iterator[str]:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not include_dotfiles and entry.name.startswith('.'):
+                    continue
+                relative_path = entry.path[prefix_len:]
+                if entry.is_dir(follow_symlinks=False):
+                    if not should_exclude(relative_path, entry.name, exclude_re):
+                        yield from _walk(entry.path)
+                elif entry.is_file():
+                    if not should_exclude(relative_path, entry.name, exclude_re):
+                        yield relative_path
+
+    return list(_walk(base))
+
+
+def read_entry(skill_path: Path, relative_path: str) -> Tuple[ZipInfo, bytes]:
+    """
+    Read one file and build its archive entry (name, mtime, permissions)
+
+    Returns the ZipInfo and file contents, ready for ZipFile.writestr().
+    """
+    with open(skill_path / relative_path, 'rb', buffering=0) as f:
+        st = os.fstat(f.fileno())
+        data = f.readall()
+
+    zinfo = ZipInfo(os.path.join(skill_path.name, relative_path), time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    return zinfo, data
+
+
+def write_files(zipf: ZipFile, skill_path: Path, files: List[str], compression_level: int) -> None:
+    """
+    Add files to the archive, reading them ahead on a thread pool
+
+    Files are read concurrently while the calling thread compresses and
+    appends them in order with the public ZipFile.writestr().
+    """
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        entries = executor.map(lambda relative_path: read_entry(skill_path, relative_path), files)
+        for zinfo, data in entries:
+            zipf.writestr(zinfo, data, compress_type=ZIP_DEFLATED, compresslevel=compression_level)
 
 
 def package_skill(
     skill_path: Path,
     output_dir: Optional[Path] = None,
     config: Optional[SkillCreatorConfig] = None,
-    skip_validation: bool = False
+    skip_validation: bool = False,
+    compression_level: Optional[int] = None
 ) -> Optional[Path]:
     """
     Package a skill into a .skill file (ZIP archive)
@@ -116,100 +142,125 @@ def package_skill(
         output_dir: Optional output directory (uses config default if None)
         config: Optional configuration (loads from config.toml if None)
         skip_validation: Skip validation step
+        compression_level: Optional ZIP compression level (overrides config)
     
     Returns:
         Path to created .skill file, or None if error
     """
     if config is None:
         config = load_config()
+    if compression_level is None:
+        compression_level = config.packaging.compression_level
     
-    skill_path = skill_path.resolve()
+    # Resolve once; everything below works with the canonical path
+    try:
+        skill_path = skill_path.resolve(strict=True)
+    except OSError:
+        log(f"❌ [bold red]Error:[/bold red] Skill directory not found: {skill_path}")
+        return None
+    
+    if not skill_path.is_dir():
+        log(f"❌ [bold red]Error:[/bold red] Path is not a directory: {skill_path}")
+        return None
+    
+    # Walk the skill tree once; validation reuses the file list
+    try:
+        files_to_package = collect_files(
+            skill_path,
+            config.packaging.exclude_patterns,
+            config.packaging.include_dotfiles
+        )
+    except OSError as e:
+        log(f"❌ [bold red]Error:[/bold red] Could not read skill directory: {e}")
+        return None
     
     # Validate first (unless skipped)
     if not skip_validation:
-        console.print("🔍 [bold]Step 1:[/bold] Validating skill...\n")
-        valid, msg = validate_skill(skill_path, config)
+        log("🔍 [bold]Step 1:[/bold] Validating skill...\n")
+        valid, msg = validate_skill(skill_path, config, files_to_package)
         if not valid:
-            console.print(f"\n❌ [bold red]Validation failed:[/bold red] {msg}")
-            console.print("💡 Fix validation errors before packaging")
+            log(f"\n❌ [bold red]Validation failed:[/bold red] {msg}")
+            log("💡 Fix validation errors before packaging")
             return None
-        console.print()
+        log()
     
     # Determine output directory
     if output_dir is None:
         output_dir = skill_path.parent / config.packaging.output_dir
+    else:
+        output_dir = output_dir.resolve()
     
-    output_dir = output_dir.resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Create .skill filename
     skill_name = skill_path.name
     skill_file = output_dir / f"{skill_name}.skill"
     
-    console.print(f"📦 [bold]Step 2:[/bold] Packaging skill '{skill_name}'...")
-    
-    # Count files to package
-    files_to_package = []
-    for file_path in skill_path.rglob("*"):
-        if file_path.is_file():
-            if not should_exclude(
-                file_path, 
-                skill_path, 
-                config.packaging.exclude_patterns,
-                config.packaging.include_dotfiles
-            ):
-                files_to_package.append(file_path)
+    log(f"📦 [bold]Step 2:[/bold] Packaging skill '{skill_name}'...")
     
     if not files_to_package:
-        console.print("❌ [bold red]Error:[/bold red] No files to package")
+        log("❌ [bold red]Error:[/bold red] No files to package")
         return None
     
-    console.print(f"   📄 Found {len(files_to_package)} files to package")
+    log(f"   📄 Found {len(files_to_package)} files to package")
     
     # Create ZIP archive
     try:
-        with ZipFile(skill_file, 'w', ZIP_DEFLATED, compresslevel=config.packaging.compression_level) as zipf:
-            for file_path in files_to_package:
-                arcname = file_path.relative_to(skill_path.parent)
-                zipf.write(file_path, arcname)
+        with ZipFile(skill_file, 'w', ZIP_DEFLATED, compresslevel=compression_level) as zipf:
+            write_files(zipf, skill_path, files_to_package, compression_level)
         
-        file_size = skill_file.stat().st_size
-        size_kb = file_size / 1024
+        size_kb = skill_file.stat().st_size / 1024
         
-        console.print(f"\n✅ [bold green]Success![/bold green]")
-        console.print(f"   📦 Created: {skill_file}")
-        console.print(f"   📊 Size: {size_kb:.1f} KB")
-        console.print(f"   🗜️  Compression: Level {config.packaging.compression_level}")
+        log(f"\n✅ [bold green]Success![/bold green]")
+        log(f"   📦 Created: {skill_file}")
+        log(f"   📊 Size: {size_kb:.1f} KB")
+        log(f"   🗜️  Compression: Level {compression_level}")
         
         return skill_file
         
     except Exception as e:
-        console.print(f"\n❌ [bold red]Error creating package:[/bold red] {e}")
+        log(f"\n❌ [bold red]Error creating package:[/bold red] {e}")
         return None
 
 
-@app.command()
-def main(
-    skill_path: Annotated[Path, typer.Argument(help="Path to the skill directory to package")],
-    output_dir: Annotated[Optional[Path], typer.Option("--output", "-o", help="Output directory for .skill file")] = None,
-    skip_validation: Annotated[bool, typer.Option("--skip-validation", help="Skip validation step")] = False,
-):
-    """
-    Package a skill into a distributable .skill file.
-    
-    Validates the skill structure and creates a ZIP archive with proper exclusions.
-    """
-    console.print("\n📦 [bold cyan]Skill Packager[/bold cyan]\n")
-    
-    result = package_skill(skill_path, output_dir, skip_validation=skip_validation)
-    
-    if result:
-        console.print()
-        raise typer.Exit(0)
-    else:
-        console.print()
-        raise typer.Exit(1)
+def _cli() -> None:
+    """Build and run the Typer CLI (typer and rich are only imported here)"""
+    import typer
+    from typing_extensions import Annotated
 
+    use_rich()
+    app = typer.Typer(help="📦 Skill Packager - Creates distributable .skill files")
+
+    @app.command()
+    def main(
+        skill_path: Annotated[Path, typer.Argument(help="Path to the skill directory to package")],
+        output_dir: Annotated[Optional[Path], typer.Option("--output", "-o", help="Output directory for .skill file")] = None,
+        skip_validation: Annotated[bool, typer.Option("--skip-validation", help="Skip validation step")] = False,
+        fast: Annotated[bool, typer.Option("--fast", help="Use fastest compression (level 1)")] = False,
+    ):
+        """
+        Package a skill into a distributable .skill file.
+
+        Validates the skill structure and creates a ZIP archive with proper exclusions.
+        """
+        log("\n📦 [bold cyan]Skill Packager[/bold cyan]\n")
+
+        result = package_skill(
+            skill_path,
+            output_dir,
+            skip_validation=skip_validation,
+            compression_level=1 if fast else None
+        )
+
+        if result:
+            log()
+            raise typer.Exit(0)
+        else:
+            log()
+            raise typer.Exit(1)
 
-if __name__ == "__main__":
     app()
+
+
+if __name__ == "__main__":
+    _cli()
@@ -5,69 +5,40 @@ Validates skill structure, naming conventions, and content quality.
 Uses Pydantic for type-safe configuration and Typer for modern CLI.
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional
-import re
+from typing import Collection, List, Tuple, Optional, Union
+import string
 
 # ============================================================================
 # PREREQUISITE CHECKS
 # ============================================================================
 
-def check_prerequisites() -> Tuple[bool, str]:
-    """Check if all required dependencies are installed"""
-    missing = []
-    
-    try:
-        import yaml
-    except ImportError:
-        missing.append("pyyaml")
-    
-    try:
-        from rich.console import Console
-    except ImportError:
-        missing.append("rich")
-    
-    try:
-        from pydantic import BaseModel
-    except ImportError:
-        missing.append("pydantic")
-    
-    try:
-        import typer
-    except ImportError:
-        missing.append("typer")
-    
-    if missing:
-        deps = " ".join(missing)
-        return False, f"Missing dependencies: {deps}\n💡 Install with: pip install {deps}"
-    
-    return True, "All dependencies available"
+try:
+    from _prereqs import check_prerequisites
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from _prereqs import check_prerequisites
 
+prereq_ok, prereq_msg = check_prerequisites("yaml", "pydantic", "typer", "rich")
 
-# Check prerequisites first
-prereq_ok, prereq_msg = check_prerequisites()
 if not prereq_ok:
     print(f"❌ {prereq_msg}")
     sys.exit(1)
 
 # Now import the rest after prerequisite check
 import yaml
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from typing_extensions import Annotated
-
-# Import Pydantic models
 try:
-    from config_models import SkillCreatorConfig, SkillMetadata
+    from yaml import CSafeLoader as _SafeLoader
 except ImportError:
-    sys.path.insert(0, str(Path(__file__).parent))
-    from config_models import SkillCreatorConfig, SkillMetadata
+    from yaml import SafeLoader as _SafeLoader
 
-console = Console()
-app = typer.Typer(help="🔍 Skill Validation Tool - Validates skill structure and content")
+# Import Pydantic models
+from config_models import SkillCreatorConfig, SkillMetadata, load_config_file
+from _output import get_console, log, use_rich
 
 # ============================================================================
 # CONFIGURATION
@@ -79,9 +50,9 @@ def load_config() -> SkillCreatorConfig:
     config_path = script_dir.parent / "config.toml"
     
     if config_path.exists():
-        return SkillCreatorConfig.from_toml(config_path)
+        return load_config_file(config_path)
     else:
-        console.print("⚠️  [yellow]Warning:[/yellow] config.toml not found, using defaults")
+        log("⚠️  [yellow]Warning:[/yellow] config.toml not found, using defaults")
         return SkillCreatorConfig()
 
 
@@ -89,45 +60,114 @@ def load_config() -> SkillCreatorConfig:
 # VALIDATION FUNCTIONS
 # ============================================================================
 
-def validate_skill_structure(skill_path: Path) -> Tuple[bool, str]:
-    """Validate basic skill directory structure"""
-    if not skill_path.exists():
+@lru_cache(maxsize=4)
+def _name_strip_table(allow_uppercase: bool, allow_underscores: bool) -> dict:
+    """
+    Build a str.translate table that deletes every allowed skill name character
+    
+    A name is valid iff translating it leaves nothing behind.
+    """
+    allowed = string.ascii_lowercase + string.digits + "-"
+    if allow_uppercase:
+        allowed += string.ascii_uppercase
+    if allow_underscores:
+        allowed += "_"
+    return str.maketrans("", "", allowed)
+
+
+def validate_skill_structure(skill_path: Path, files: Optional[Collection[str]] = None) -> Tuple[bool, str]:
+    """
+    Validate basic skill directory structure
+    
+    If files (paths relative to skill_path from an earlier walk) is given,
+    it is checked instead of stat()ing the directory again.
+    """
+    if files is not None:
+        if "SKILL.md" not in files:
+            return False, "SKILL.md not found"
+        return True, "Skill structure OK"
+    
+    # One stat of SKILL.md covers the common case; it can only succeed if
+    # skill_path is an existing directory. The slower checks below only run
+    # to explain a failure.
+    try:
+        os.stat(os.path.join(skill_path, "SKILL.md"))
+        return True, "Skill structure OK"
+    except OSError:
+        pass
+    
+    if not os.path.exists(skill_path):
         return False, f"Skill directory not found: {skill_path}"
     
-    if not skill_path.is_dir():
+    if not os.path.isdir(skill_path):
         return False, f"Path is not a directory: {skill_path}"
     
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
-        return False, "SKILL.md not found"
-    
-    return True, "Skill structure OK"
+    return False, "SKILL.md not found"
+
+
+def read_frontmatter_block(skill_md: Union[str, Path], chunk_size: int = 4096) -> str:
+    """
+    Read SKILL.md only up to the end of its YAML frontmatter
+
+    The file is read in chunk_size pieces until the closing delimiter has
+    been seen (or EOF), so the cost is proportional to the frontmatter and
+    the (possibly long) body is never read. Files that do not start with
+    "---" stop after the first chunk.
+    """
+    buf = b""
+    end = -1
+    with open(skill_md, 'rb', buffering=0) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            # Resume the search a few bytes back so a delimiter split across
+            # two chunks is still found
+            start = max(4, len(buf) - 3)
+            buf += chunk
+            if len(buf) >= 3 and not buf.startswith(b"---"):
+                break
+            end = buf.find(b"\n---", start)
+            if end >= 0:
+                break
+    
+    if end >= 0:
+        buf = buf[:end + 4]
+    # Match read_text()'s universal newlines so CRLF files still validate
+    return buf.decode('utf-8', errors='replace').replace('\r\n', '\n').replace('\r', '\n')
 
 
 def validate_frontmatter(content: str, config: SkillCreatorConfig) -> Tuple[bool, str, Optional[dict]]:
     """Validate YAML frontmatter"""
     if not content.startswith("---"):
         return False, "No YAML frontmatter found", None
-    
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    end = content.find("\n---", 4)
+    if end < 0 or not content.startswith("---\n"):
         return False, "Invalid frontmatter format", None
     
-    frontmatter_text = match.group(1)
+    frontmatter_text = content[4:end]
     
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml.load(frontmatter_text, Loader=_SafeLoader)
         if not isinstance(frontmatter, dict):
             return False, "Frontmatter must be a YAML dictionary", None
     except yaml.YAMLError as e:
+        if _SafeLoader is not yaml.SafeLoader:
+            # libyaml errors carry no source snippet; re-parse with the
+            # pure-Python loader so the message shows the line and caret
+            try:
+                yaml.load(frontmatter_text, Loader=yaml.SafeLoader)
+            except yaml.YAMLError as detailed:
+                e = detailed
         return False, f"Invalid YAML in frontmatter: {e}", None
     
     # Check for unexpected properties
-    unexpected = set(frontmatter.keys()) - config.validation.allowed_properties
+    allowed = config.validation.allowed_properties
+    unexpected = [key for key in frontmatter if key not in allowed]
     if unexpected:
         return False, (
             f"Unexpected frontmatter keys: {', '.join(sorted(unexpected))}\n"
-            f"   Allowed: {', '.join(sorted(config.validation.allowed_properties))}"
+            f"   Allowed: {config.validation.allowed_properties_display}"
         ), None
     
     # Check required fields
@@ -136,14 +176,19 @@ def validate_frontmatter(content: str, config: SkillCreatorConfig) -> Tuple[bool
     if config.validation.require_description and "description" not in frontmatter:
         return False, "Missing 'description' field in frontmatter", None
     
+    # Check field types once so name/description validators get strings
+    name = frontmatter["name"]
+    if not isinstance(name, str):
+        return False, f"Name must be a string, got {type(name).__name__}", None
+    description = frontmatter.get("description", "")
+    if not isinstance(description, str):
+        return False, f"Description must be a string, got {type(description).__name__}", None
+    
     return True, "Frontmatter structure OK", frontmatter
 
 
 def validate_skill_name(name: str, config: SkillCreatorConfig) -> Tuple[bool, str]:
-    """Validate skill name against rules"""
-    if not isinstance(name, str):
-        return False, f"Name must be a string, got {type(name).__name__}"
-    
+    """Validate skill name against rules (type is checked by validate_frontmatter)"""
     name = name.strip()
     rules = config.validation
     
@@ -154,14 +199,7 @@ def validate_skill_name(name: str, config: SkillCreatorConfig) -> Tuple[bool, st
         return False, f"Name too long ({len(name)} chars, max: {rules.max_name_length})"
     
     # Check naming convention
-    pattern = r"^[a-z0-9-"
-    if rules.allow_uppercase:
-        pattern = r"^[a-zA-Z0-9-"
-    if rules.allow_underscores:
-        pattern += "_"
-    pattern += "]+$"
-    
-    if not re.match(pattern, name):
+    if not name or name.translate(_name_strip_table(rules.allow_uppercase, rules.allow_underscores)):
         chars_allowed = "lowercase letters, digits, and hyphens"
         if rules.allow_uppercase:
             chars_allowed = "letters, digits, and hyphens"
@@ -177,10 +215,7 @@ def validate_skill_name(name: str, config: SkillCreatorConfig) -> Tuple[bool, st
 
 
 def validate_description(description: str, config: SkillCreatorConfig) -> Tuple[bool, str]:
-    """Validate skill description"""
-    if not isinstance(description, str):
-        return False, f"Description must be a string, got {type(description).__name__}"
-    
+    """Validate skill description (type is checked by validate_frontmatter)"""
     description = description.strip()
     rules = config.validation
     
@@ -203,13 +238,44 @@ def validate_description(description: str, config: SkillCreatorConfig) -> Tuple[
     return True, f"Description OK ({len(description)} chars)"
 
 
-def validate_skill(skill_path: Path, config: Optional[SkillCreatorConfig] = None) -> Tuple[bool, str]:
+def print_results(results: List[Tuple[str, bool, str]]) -> None:
+    """Print (check, valid, details) rows as a Rich table, or plain lines without Rich"""
+    console = get_console()
+    if console is None:
+        for check, valid, msg in results:
+            print(f"{'✅' if valid else '❌'} {check}: {msg}")
+        return
+    
+    from rich.table import Table
+    
+    table = Table(title="🔍 Skill Validation Results", show_header=True)
+    table.add_column("Check", style="cyan")
+    table.add_column("Status", style="bold")
+    table.add_column("Details", style="dim")
+    for check, valid, msg in results:
+        table.add_row(check, "✅" if valid else "❌", msg)
+    console.print(table)
+
+
+def validate_skill(
+    skill_path: Path,
+    config: Optional[SkillCreatorConfig] = None,
+    files: Optional[Collection[str]] = None,
+    content: Optional[str] = None,
+    verbose: bool = True
+) -> Tuple[bool, str]:
     """
     Main validation function
     
     Args:
         skill_path: Path to the skill directory
         config: Optional configuration (loads from config.toml if None)
+        files: Optional file list from an existing walk of skill_path
+               (relative paths), reused for the structure check
+        content: Optional SKILL.md text the caller already has (the whole
+                 file or just its frontmatter block); read from disk if None
+        verbose: Print the results table and verdict; pass False when only
+                 the returned result is needed
     
     Returns:
         Tuple of (is_valid: bool, message: str)
@@ -217,81 +283,158 @@ def validate_skill(skill_path: Path, config: Optional[SkillCreatorConfig] = None
     if config is None:
         config = load_config()
     
-    # Create results table
-    table = Table(title="🔍 Skill Validation Results", show_header=True)
-    table.add_column("Check", style="cyan")
-    table.add_column("Status", style="bold")
-    table.add_column("Details", style="dim")
-    
+    results: List[Tuple[str, bool, str]] = []
     all_valid = True
     
     # 1. Validate structure
-    valid, msg = validate_skill_structure(skill_path)
-    status = "✅" if valid else "❌"
-    table.add_row("Structure", status, msg)
+    valid, msg = validate_skill_structure(skill_path, files)
+    results.append(("Structure", valid, msg))
     if not valid:
-        console.print(table)
+        if verbose:
+            print_results(results)
         return False, msg
     
-    # Read SKILL.md
-    skill_md = skill_path / "SKILL.md"
-    content = skill_md.read_text()
+    # Read SKILL.md frontmatter
+    if content is None:
+        content = read_frontmatter_block(os.path.join(skill_path, "SKILL.md"))
     
     # 2. Validate frontmatter
     valid, msg, frontmatter = validate_frontmatter(content, config)
-    status = "✅" if valid else "❌"
-    table.add_row("Frontmatter", status, msg)
+    results.append(("Frontmatter", valid, msg))
     if not valid:
-        console.print(table)
+        if verbose:
+            print_results(results)
         return False, msg
     
     # 3. Validate name
-    name = frontmatter.get("name", "")
+    name = frontmatter["name"]
     valid, msg = validate_skill_name(name, config)
-    status = "✅" if valid else "❌"
-    table.add_row("Skill Name", status, msg)
+    results.append(("Skill Name", valid, msg))
     all_valid = all_valid and valid
     
     # 4. Validate description
     description = frontmatter.get("description", "")
     valid, msg = validate_description(description, config)
-    status = "✅" if valid else "❌"
-    table.add_row("Description", status, msg)
+    results.append(("Description", valid, msg))
     all_valid = all_valid and valid
     
+    if not verbose:
+        return (True, "Skill is valid!") if all_valid else (False, "Skill has validation errors")
+    
     # Print results
-    console.print(table)
+    print_results(results)
     
     if all_valid:
-        console.print("\n🎉 [bold green]Skill is valid![/bold green]")
+        log("\n🎉 [bold green]Skill is valid![/bold green]")
         return True, "Skill is valid!"
     else:
-        console.print("\n❌ [bold red]Skill validation failed[/bold red]")
+        log("\n❌ [bold red]Skill validation failed[/bold red]")
         return False, "Skill has validation errors"
 
 
-# ============================================================================
-# CLI INTERFACE
-# ============================================================================
-
-@app.command()
-def main(
-    skill_path: Annotated[Path, typer.Argument(help="Path to the skill directory to validate")],
-):
+def validate_all_skills(
+    root: Path,
+    config: Optional[SkillCreatorConfig] = None,
+    max_workers: Optional[int] = None
+) -> List[Tuple[str, bool, str]]:
     """
-    Validate a skill's structure and content.
+    Validate every skill directory directly under root
     
-    Checks SKILL.md frontmatter, naming conventions, and content requirements.
+    Config is loaded once and shared; skills are validated concurrently
+    with verbose=False, so nothing is printed per skill.
+    
+    Args:
+        root: Directory containing skill directories
+        config: Optional configuration (loads from config.toml if None)
+        max_workers: Thread pool size (defaults to os.cpu_count())
+    
+    Returns:
+        List of (skill name, is_valid, message) sorted by skill name
     """
-    console.print(f"\n🔍 [bold]Validating skill:[/bold] {skill_path}\n")
+    if config is None:
+        config = load_config()
+    
+    with os.scandir(root) as it:
+        skill_dirs = sorted(
+            entry.name for entry in it
+            if entry.is_dir() and not entry.name.startswith('.')
+        )
     
-    valid, message = validate_skill(skill_path)
+    def check(name: str) -> Tuple[str, bool, str]:
+        # One unreadable skill is reported as a failure, not fatal to the batch
+        try:
+            valid, msg = validate_skill(os.path.join(root, name), config, verbose=False)
+        except (OSError, UnicodeDecodeError) as e:
+            return name, False, str(e)
+        return name, valid, msg
     
-    if valid:
-        raise typer.Exit(0)
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(check, skill_dirs))
+
+
+def print_summary(results: List[Tuple[str, bool, str]]) -> None:
+    """Print (skill, valid, message) rows from validate_all_skills"""
+    console = get_console()
+    if console is None:
+        for skill, valid, msg in results:
+            print(f"{'✅' if valid else '❌'} {skill}: {msg}")
     else:
-        raise typer.Exit(1)
+        from rich.table import Table
+        
+        table = Table(title="🔍 Skill Validation Summary", show_header=True)
+        table.add_column("Skill", style="cyan")
+        table.add_column("Status", style="bold")
+        table.add_column("Details", style="dim")
+        for skill, valid, msg in results:
+            table.add_row(skill, "✅" if valid else "❌", msg)
+        console.print(table)
+    
+    failed = sum(1 for _, valid, _ in results if not valid)
+    log(f"\n{len(results) - failed}/{len(results)} skills valid")
 
 
-if __name__ == "__main__":
+# ============================================================================
+# CLI INTERFACE
+# ============================================================================
+
+def _cli() -> None:
+    """Build and run the Typer CLI (typer and rich are only imported here)"""
+    import typer
+    from typing_extensions import Annotated
+
+    use_rich()
+    app = typer.Typer(help="🔍 Skill Validation Tool - Validates skill structure and content")
+
+    @app.command()
+    def main(
+        skill_path: Annotated[Path, typer.Argument(help="Path to the skill directory to validate")],
+        all_skills: Annotated[bool, typer.Option("--all", help="Validate every skill directory under SKILL_PATH")] = False,
+    ):
+        """
+        Validate a skill's structure and content.
+
+        Checks SKILL.md frontmatter, naming conventions, and content requirements.
+        """
+        if all_skills:
+            if not skill_path.is_dir():
+                log(f"❌ [bold red]Error:[/bold red] Not a directory: {skill_path}")
+                raise typer.Exit(1)
+            log(f"\n🔍 [bold]Validating skills in:[/bold] {skill_path}\n")
+            results = validate_all_skills(skill_path)
+            print_summary(results)
+            raise typer.Exit(0 if all(valid for _, valid, _ in results) else 1)
+
+        log(f"\n🔍 [bold]Validating skill:[/bold] {skill_path}\n")
+
+        valid, message = validate_skill(skill_path)
+
+        if valid:
+            raise typer.Exit(0)
+        else:
+            raise typer.Exit(1)
+
     app()
+
+
+if __name__ == "__main__":
+    _cli()
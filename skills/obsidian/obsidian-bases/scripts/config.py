@@ -1,9 +1,12 @@
 """Configuration management for Obsidian Bases validation."""
 
+import itertools
+import re
 import sys
 from pathlib import Path
-from typing import Set
-from dataclasses import dataclass
+from typing import FrozenSet, Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 try:
     import tomllib  # Python 3.11+
@@ -14,42 +17,47 @@ except ImportError:
         tomllib = None
 
 
+def _interned(values: Iterable[str]) -> FrozenSet[str]:
+    """Build an immutable set of interned strings from a TOML list."""
+    return frozenset(sys.intern(v) for v in values)
+
+
 @dataclass
 class ValidationConfig:
     """Configuration for base file validation. All values loaded from TOML."""
     
     # Valid view types
-    valid_view_types: Set[str]
+    valid_view_types: FrozenSet[str]
     
     # Valid sort directions
-    valid_directions: Set[str]
+    valid_directions: FrozenSet[str]
     
     # Valid built-in summary functions
-    valid_summaries: Set[str]
+    valid_summaries: FrozenSet[str]
     
     # Known property fields
-    known_property_fields: Set[str]
+    known_property_fields: FrozenSet[str]
     
     # Known view fields
-    known_view_fields: Set[str]
+    known_view_fields: FrozenSet[str]
     
     # Filter operators
-    comparison_operators: Set[str]
-    logical_operators: Set[str]
+    comparison_operators: FrozenSet[str]
+    logical_operators: FrozenSet[str]
     
     # File functions
-    valid_file_functions: Set[str]
+    valid_file_functions: FrozenSet[str]
     
     # Formula functions (from references/formulas.md)
-    global_functions: Set[str]
-    date_functions: Set[str]
-    string_functions: Set[str]
-    number_functions: Set[str]
-    list_functions: Set[str]
-    type_functions: Set[str]
+    global_functions: FrozenSet[str]
+    date_functions: FrozenSet[str]
+    string_functions: FrozenSet[str]
+    number_functions: FrozenSet[str]
+    list_functions: FrozenSet[str]
+    type_functions: FrozenSet[str]
     
     # File properties (from references/properties.md)
-    file_properties: Set[str]
+    file_properties: FrozenSet[str]
     
     # Validation strictness
     require_views: bool
@@ -59,6 +67,22 @@ class ValidationConfig:
     allow_unknown_view_fields: bool
     allow_unknown_property_fields: bool
     
+    # Sorted, comma-separated names for error messages (derived in __post_init__)
+    valid_view_types_display: str = field(init=False, repr=False)
+    known_view_fields_display: str = field(init=False, repr=False)
+    known_property_fields_display: str = field(init=False, repr=False)
+    
+    # Matches file.<name>( calls whose name is not in valid_file_functions,
+    # compiled once at load so a future check can scan a whole expression
+    unknown_file_function_re: 're.Pattern[str]' = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        known = '|'.join(sorted(map(re.escape, self.valid_file_functions), key=len, reverse=True))
+        self.unknown_file_function_re = re.compile(rf"\bfile\.(?!(?:{known})\()(\w+)\(")
+        self.valid_view_types_display = ', '.join(sorted(self.valid_view_types))
+        self.known_view_fields_display = ', '.join(sorted(self.known_view_fields))
+        self.known_property_fields_display = ', '.join(sorted(self.known_property_fields))
+    
     @classmethod
     def load_from_toml(cls, toml_path: Path) -> 'ValidationConfig':
         """
@@ -101,28 +125,30 @@ class ValidationConfig:
             
             return cls(
                 # View configuration
-                valid_view_types=set(view_types_cfg['valid']),
-                valid_directions=set(sort_cfg['directions']),
-                valid_summaries=set(summaries_cfg['built_in']),
-                known_property_fields=set(property_fields_cfg['known']),
-                known_view_fields=set(view_fields_cfg['known']),
+                valid_view_types=_interned(view_types_cfg['valid']),
+                valid_directions=_interned(sort_cfg['directions']),
+                valid_summaries=_interned(summaries_cfg['built_in']),
+                known_property_fields=_interned(property_fields_cfg['known']),
+                known_view_fields=_interned(view_fields_cfg['known']),
                 
                 # Filter configuration
-                comparison_operators=set(filter_ops_cfg['comparison']),
-                logical_operators=set(filter_ops_cfg['logical']),
-                valid_file_functions=set(file_funcs_cfg['valid']),
+                comparison_operators=_interned(filter_ops_cfg['comparison']),
+                logical_operators=_interned(filter_ops_cfg['logical']),
+                valid_file_functions=_interned(file_funcs_cfg['valid']),
                 
                 # Formula configuration
-                global_functions=set(formula_funcs_cfg['global']),
-                date_functions=set(formula_funcs_cfg['date']),
-                string_functions=set(formula_funcs_cfg['string']),
-                number_functions=set(formula_funcs_cfg['number']),
-                list_functions=set(formula_funcs_cfg['list']),
-                type_functions=set(formula_funcs_cfg['type']),
+                global_functions=_interned(formula_funcs_cfg['global']),
+                date_functions=_interned(formula_funcs_cfg['date']),
+                string_functions=_interned(formula_funcs_cfg['string']),
+                number_functions=_interned(formula_funcs_cfg['number']),
+                list_functions=_interned(formula_funcs_cfg['list']),
+                type_functions=_interned(formula_funcs_cfg['type']),
                 
                 # Property configuration
-                file_properties=set(file_props_cfg['basic'] + file_props_cfg['timestamps'] + 
-                                  file_props_cfg['size'] + file_props_cfg['links']),
+                file_properties=_interned(itertools.chain(
+                    file_props_cfg['basic'], file_props_cfg['timestamps'],
+                    file_props_cfg['size'], file_props_cfg['links']
+                )),
                 
                 # Validation strictness
                 require_views=validation['require_views'],
@@ -139,3 +165,31 @@ class ValidationConfig:
         except Exception as e:
             print(f"Error: Failed to load configuration from {toml_path}: {e}")
             sys.exit(1)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(toml_path: str, mtime_ns: int) -> ValidationConfig:
+    """Parse a config file once per (path, mtime) pair."""
+    return ValidationConfig.load_from_toml(Path(toml_path))
+
+
+def get_config(toml_path: Path) -> ValidationConfig:
+    """
+    Return the ValidationConfig for toml_path, parsing it only once per process.
+    
+    The cache is keyed on the file's mtime, so edits to validate.toml are
+    picked up on the next call. Callers share the returned instance and must
+    not mutate it.
+    
+    Args:
+        toml_path: Path to TOML configuration file
+        
+    Returns:
+        ValidationConfig instance
+    """
+    try:
+        mtime_ns = toml_path.stat().st_mtime_ns
+    except OSError:
+        # Let load_from_toml report the missing file
+        return ValidationConfig.load_from_toml(toml_path)
+    return _load_cached(str(toml_path.resolve()), mtime_ns)
@@ -11,7 +11,7 @@ Usage:
 import sys
 from pathlib import Path
 
-from config import ValidationConfig
+from config import get_config
 from validators import BaseValidator
 
 
@@ -36,7 +36,7 @@ def main():
     
     # Load config from TOML file
     config_path = Path(__file__).parent / "validate.toml"
-    config = ValidationConfig.load_from_toml(config_path)
+    config = get_config(config_path)
     
     # Create validator with loaded config
     validator = BaseValidator(sys.argv[1], config)
@@ -1,7 +1,12 @@
 """Main base file validator orchestrating all specialized validators."""
 
 import yaml
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 from pathlib import Path
+import sys
 from typing import Dict, List, Optional
 
 from config import ValidationConfig
@@ -11,6 +16,9 @@ from .property_validator import PropertyValidator
 from .view_validator import ViewValidator
 
 
+_SUMMARIES_EXAMPLE = sys.intern("Example:\n  summaries:\n    avgValue: 'values.mean().round(2)'")
+
+
 class BaseValidator:
     """Orchestrates validation of entire base files using specialized validators."""
     
@@ -59,39 +67,38 @@ class BaseValidator:
     def _parse_yaml(self, content: str) -> Optional[Dict]:
         """Parse YAML content."""
         try:
-            return yaml.safe_load(content)
+            return yaml.load(content, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             self.errors.append(f"YAML parsing error: {e}")
             return None
     
     def _validate_with_validators(self, data: Dict) -> None:
-        """Use specialized validators for each section."""
+        """
+        Use specialized validators for each section, collecting into self.errors/warnings.
+        
+        Missing sections are skipped without building a validator, except
+        views when require_views is set so the missing-views error is reported.
+        """
         # Validate filters
-        filter_validator = FilterValidator(self.config)
-        filter_validator.validate(data.get('filters'))
-        self.errors.extend(filter_validator.errors)
-        self.warnings.extend(filter_validator.warnings)
+        if (filters := data.get('filters')) is not None:
+            FilterValidator(self.config, self.errors, self.warnings).validate(filters)
         
         # Validate formulas
-        formula_validator = FormulaValidator(self.config)
-        formula_validator.validate(data.get('formulas'))
-        self.errors.extend(formula_validator.errors)
-        self.warnings.extend(formula_validator.warnings)
+        if (formulas := data.get('formulas')) is not None:
+            FormulaValidator(self.config, self.errors, self.warnings).validate(formulas)
         
         # Validate properties
-        property_validator = PropertyValidator(self.config)
-        property_validator.validate(data.get('properties'))
-        self.errors.extend(property_validator.errors)
-        self.warnings.extend(property_validator.warnings)
+        if (properties := data.get('properties')) is not None:
+            PropertyValidator(self.config, self.errors, self.warnings).validate(properties)
         
         # Validate summaries (simple validation)
-        self._validate_summaries(data.get('summaries'))
+        if (summaries := data.get('summaries')) is not None:
+            self._validate_summaries(summaries)
         
         # Validate views
-        view_validator = ViewValidator(self.config)
-        view_validator.validate(data.get('views'))
-        self.errors.extend(view_validator.errors)
-        self.warnings.extend(view_validator.warnings)
+        views = data.get('views')
+        if views is not None or self.config.require_views:
+            ViewValidator(self.config, self.errors, self.warnings).validate(views)
     
     def _validate_summaries(self, summaries) -> None:
         """Validate summaries section (simple check)."""
@@ -101,7 +108,7 @@ class BaseValidator:
         if not isinstance(summaries, dict):
             self.errors.append(
                 f"Summaries must be an object (dictionary). Current type: {type(summaries).__name__}. "
-                f"Example:\n  summaries:\n    avgValue: 'values.mean().round(2)'"
+                + _SUMMARIES_EXAMPLE
             )
     
     def print_results(self) -> None:
@@ -1,16 +1,47 @@
 """Filter validation for Obsidian Bases."""
 
-from typing import Any, List
+import sys
+from typing import Any, List, Optional
 from config import ValidationConfig
 
 
+_FILTER_KEYS = frozenset({'and', 'or', 'not'})
+
+_FILTER_FORMATS = sys.intern(
+    "Valid formats:\n"
+    "  1. String: filters: 'property == \"value\"'\n"
+    "  2. Object: filters:\n    and:\n      - 'condition1'\n      - 'condition2'"
+)
+
+_FILTER_KEY_HINT = sys.intern(
+    f"Valid keys are: {', '.join(sorted(_FILTER_KEYS))}. "
+    "Example: filters:\n  and:\n    - 'property == \"value\"'\n    - file.hasTag(\"tag\")"
+)
+
+_EMPTY_FILTER = sys.intern(
+    "Empty filter string found. "
+    "Consider removing or using a meaningful filter expression."
+)
+
+
 class FilterValidator:
     """Validates filter sections in base files."""
     
-    def __init__(self, config: ValidationConfig):
+    def __init__(
+        self,
+        config: ValidationConfig,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            config: Validation configuration
+            errors: Optional list to append errors to (e.g. a parent validator's)
+            warnings: Optional list to append warnings to
+        """
         self.config = config
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self.errors: List[str] = errors if errors is not None else []
+        self.warnings: List[str] = warnings if warnings is not None else []
     
     def validate(self, filters: Any) -> None:
         """Validate filters section."""
@@ -24,29 +55,20 @@ class FilterValidator:
         else:
             self.errors.append(
                 f"Filters must be a string or object. Current type: {type(filters).__name__}. "
-                f"Valid formats:\n"
-                f"  1. String: filters: 'property == \"value\"'\n"
-                f"  2. Object: filters:\n    and:\n      - 'condition1'\n      - 'condition2'"
+                + _FILTER_FORMATS
             )
     
     def _validate_filter_string(self, filter_str: str) -> None:
         """Validate single filter string."""
         if not filter_str.strip():
-            self.warnings.append(
-                "Empty filter string found. "
-                "Consider removing or using a meaningful filter expression."
-            )
+            self.warnings.append(_EMPTY_FILTER)
     
     def _validate_filter_object(self, filters: dict) -> None:
         """Validate filter object with and/or/not."""
-        valid_keys = {'and', 'or', 'not'}
-        
         for key in filters:
-            if key not in valid_keys:
+            if key not in _FILTER_KEYS:
                 self.errors.append(
-                    f"Invalid filter key: '{key}'. "
-                    f"Valid keys are: {', '.join(sorted(valid_keys))}. "
-                    f"Example: filters:\n  and:\n    - 'property == \"value\"'\n    - file.hasTag(\"tag\")"
+                    f"Invalid filter key: '{key}'. " + _FILTER_KEY_HINT
                 )
             
             if not isinstance(filters[key], list):
@@ -1,16 +1,31 @@
 """Formula validation for Obsidian Bases."""
 
-from typing import Any, List
+import sys
+from typing import Any, List, Optional
 from config import ValidationConfig
 
 
+_FORMULAS_EXAMPLE = sys.intern("Example:\n  formulas:\n    my_formula: 'if(property, \"Yes\", \"No\")'")
+
+
 class FormulaValidator:
     """Validates formula sections in base files."""
     
-    def __init__(self, config: ValidationConfig):
+    def __init__(
+        self,
+        config: ValidationConfig,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            config: Validation configuration
+            errors: Optional list to append errors to (e.g. a parent validator's)
+            warnings: Optional list to append warnings to
+        """
         self.config = config
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self.errors: List[str] = errors if errors is not None else []
+        self.warnings: List[str] = warnings if warnings is not None else []
     
     def validate(self, formulas: Any) -> None:
         """Validate formulas section."""
@@ -20,7 +35,7 @@ class FormulaValidator:
         if not isinstance(formulas, dict):
             self.errors.append(
                 f"Formulas must be an object (dictionary). Current type: {type(formulas).__name__}. "
-                f"Example:\n  formulas:\n    my_formula: 'if(property, \"Yes\", \"No\")'"
+                + _FORMULAS_EXAMPLE
             )
             return
         
@@ -1,16 +1,38 @@
 """Property validation for Obsidian Bases."""
 
-from typing import Any, List
+import sys
+from typing import Any, List, Optional
 from config import ValidationConfig
 
 
+_PROPERTIES_EXAMPLE = sys.intern("Example:\n  properties:\n    property_name:\n      displayName: \"Display Name\"")
+
+_DISPLAY_NAME_HINT = sys.intern("Add: displayName: \"Human Readable Name\"")
+
+
 class PropertyValidator:
     """Validates property sections in base files."""
     
-    def __init__(self, config: ValidationConfig):
+    def __init__(
+        self,
+        config: ValidationConfig,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            config: Validation configuration
+            errors: Optional list to append errors to (e.g. a parent validator's)
+            warnings: Optional list to append warnings to
+        """
         self.config = config
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self.errors: List[str] = errors if errors is not None else []
+        self.warnings: List[str] = warnings if warnings is not None else []
+        
+        # Resolve the per-property checks once instead of on every property;
+        # None disables the unknown-key check
+        self._warn_display_name = config.warn_missing_display_name
+        self._known_keys = None if config.allow_unknown_property_fields else config.known_property_fields
     
     def validate(self, properties: Any) -> None:
         """Validate properties section."""
@@ -20,7 +42,7 @@ class PropertyValidator:
         if not isinstance(properties, dict):
             self.errors.append(
                 f"Properties must be an object (dictionary). Current type: {type(properties).__name__}. "
-                f"Example:\n  properties:\n    property_name:\n      displayName: \"Display Name\""
+                + _PROPERTIES_EXAMPLE
             )
             return
         
@@ -37,17 +59,17 @@ class PropertyValidator:
             )
             return
         
-        if self.config.warn_missing_display_name and 'displayName' not in config:
+        if self._warn_display_name and 'displayName' not in config:
             self.warnings.append(
-                f"Property '{prop_name}' missing 'displayName'. "
-                f"Add: displayName: \"Human Readable Name\""
+                f"Property '{prop_name}' missing 'displayName'. " + _DISPLAY_NAME_HINT
             )
         
         # Check for unknown keys (if strict mode enabled)
-        if not self.config.allow_unknown_property_fields:
-            unknown = set(config.keys()) - self.config.known_property_fields
+        known = self._known_keys
+        if known is not None:
+            unknown = [key for key in config if key not in known]
             if unknown:
                 self.warnings.append(
                     f"Property '{prop_name}' has unknown keys: {', '.join(unknown)}. "
-                    f"Known keys: {', '.join(self.config.known_property_fields)}"
+                    f"Known keys: {self.config.known_property_fields_display}"
                 )
@@ -1,22 +1,44 @@
 """View validation for Obsidian Bases."""
 
-from typing import Any, List
+import sys
+from typing import Any, List, Optional
 from config import ValidationConfig
 
 
+_NO_VIEWS = sys.intern("Base file must have at least one view")
+
+
 class ViewValidator:
     """Validates view sections in base files."""
     
-    def __init__(self, config: ValidationConfig):
+    def __init__(
+        self,
+        config: ValidationConfig,
+        errors: Optional[List[str]] = None,
+        warnings: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            config: Validation configuration
+            errors: Optional list to append errors to (e.g. a parent validator's)
+            warnings: Optional list to append warnings to
+        """
         self.config = config
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
+        self.errors: List[str] = errors if errors is not None else []
+        self.warnings: List[str] = warnings if warnings is not None else []
+        
+        # Resolve the per-view checks once instead of on every view;
+        # None disables the unknown-field check
+        self._require_type = config.require_view_type
+        self._require_name = config.require_view_name
+        self._valid_types = config.valid_view_types
+        self._known_fields = None if config.allow_unknown_view_fields else config.known_view_fields
     
     def validate(self, views: Any) -> None:
         """Validate views section."""
         if views is None:
             if self.config.require_views:
-                self.errors.append("Base file must have at least one view")
+                self.errors.append(_NO_VIEWS)
             return
         
         if not isinstance(views, list):
@@ -24,7 +46,7 @@ class ViewValidator:
             return
         
         if len(views) == 0 and self.config.require_views:
-            self.errors.append("Base file must have at least one view")
+            self.errors.append(_NO_VIEWS)
         
         for i, view in enumerate(views):
             self._validate_view(view, i)
@@ -36,22 +58,24 @@ class ViewValidator:
             return
         
         # Check required fields
-        if self.config.require_view_type and 'type' not in view:
+        if 'type' in view:
+            if view['type'] not in self._valid_types:
+                self.errors.append(
+                    f"View {index} has invalid type '{view['type']}'. "
+                    f"Must be one of: {self.config.valid_view_types_display}"
+                )
+        elif self._require_type:
             self.errors.append(f"View {index} missing required 'type' field")
-        elif 'type' in view and view['type'] not in self.config.valid_view_types:
-            self.errors.append(
-                f"View {index} has invalid type '{view['type']}'. "
-                f"Must be one of: {', '.join(self.config.valid_view_types)}"
-            )
         
-        if self.config.require_view_name and 'name' not in view:
+        if self._require_name and 'name' not in view:
             self.errors.append(f"View {index} missing required 'name' field")
         
         # Check for unknown fields
-        if not self.config.allow_unknown_view_fields:
-            unknown = set(view.keys()) - self.config.known_view_fields
+        known = self._known_fields
+        if known is not None:
+            unknown = [key for key in view if key not in known]
             if unknown:
                 self.warnings.append(
                     f"View {index} has unknown fields: {', '.join(unknown)}. "
-                    f"Known fields: {', '.join(sorted(self.config.known_view_fields))}"
+                    f"Known fields: {self.config.known_view_fields_display}"
                 )
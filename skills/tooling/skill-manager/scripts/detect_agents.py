@@ -3,17 +3,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import sys
-from dataclasses import dataclass
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 
-@dataclass
-class Agent:
+class Agent(NamedTuple):
     """Agent definition."""
     name: str
     display_name: str
@@ -21,101 +24,169 @@ class Agent:
     local_skills_dir: str  # e.g., ".claude/skills" for project-local
     detect_cmd: list[str] | None = None
     detect_path: Path | None = None
-    builtin_install: str | None = None
+    builtin_install_parts: tuple[str, ...] | None = None  # argv prefix; skill ref appended
+    builtin_uninstall_parts: tuple[str, ...] | None = None
 
 
+_HOME = Path.home()
+_CODEX_HOME = Path(os.environ.get("CODEX_HOME", _HOME / ".codex"))
+
 # Agent registry - add new agents here
 AGENTS: list[Agent] = [
     Agent(
         name="claude",
         display_name="Claude Code",
-        skills_path=Path.home() / ".claude" / "skills",
+        skills_path=_HOME / ".claude" / "skills",
         local_skills_dir=".claude/skills",
         detect_cmd=["claude", "--version"],
-        builtin_install="claude skill install",
+        builtin_install_parts=("claude", "skill", "install"),
+        builtin_uninstall_parts=("claude", "skill", "remove"),
     ),
     Agent(
         name="codex",
         display_name="Codex",
-        skills_path=Path(os.environ.get("CODEX_HOME", Path.home() / ".codex")) / "skills",
+        skills_path=_CODEX_HOME / "skills",
         local_skills_dir=".codex/skills",
         detect_cmd=["codex", "--version"],
-        builtin_install="codex skill install",
+        builtin_install_parts=("codex", "skill", "install"),
+        builtin_uninstall_parts=("codex", "skill", "remove"),
     ),
     Agent(
         name="opencode",
         display_name="OpenCode",
-        skills_path=Path.home() / ".config" / "opencode" / "skills",
+        skills_path=_HOME / ".config" / "opencode" / "skills",
         local_skills_dir=".opencode/skills",
         detect_cmd=["opencode", "--version"],
     ),
     Agent(
         name="cursor",
         display_name="Cursor",
-        skills_path=Path.home() / ".cursor" / "skills",
+        skills_path=_HOME / ".cursor" / "skills",
         local_skills_dir=".cursor/skills",
-        detect_path=Path.home() / ".cursor",
+        detect_path=_HOME / ".cursor",
     ),
     Agent(
         name="windsurf",
         display_name="Windsurf",
-        skills_path=Path.home() / ".windsurf" / "skills",
+        skills_path=_HOME / ".windsurf" / "skills",
         local_skills_dir=".windsurf/skills",
-        detect_path=Path.home() / ".windsurf",
+        detect_path=_HOME / ".windsurf",
     ),
     Agent(
         name="antigravity",
         display_name="Antigravity",
-        skills_path=Path.home() / ".gemini" / "antigravity" / "skills",
+        skills_path=_HOME / ".gemini" / "antigravity" / "skills",
         local_skills_dir=".agent/skills",
-        detect_path=Path.home() / ".gemini" / "antigravity",
+        detect_path=_HOME / ".gemini" / "antigravity",
     ),
 ]
 
+AGENTS_BY_NAME: dict[str, Agent] = {a.name: a for a in AGENTS}
+
+
+@lru_cache(maxsize=32)
+def _which(cmd: str) -> str | None:
+    """shutil.which(), memoized for the life of the process."""
+    return shutil.which(cmd)
+
+
+def _probe_version(cmd: list[str]) -> str | None:
+    """Run a `--version` command; return the first output line, or None."""
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip().split("\n")[0] or None
+
 
 def detect_agent(agent: Agent) -> dict | None:
     """Check if an agent is installed."""
     version = None
     
-    # Check by command
-    if agent.detect_cmd:
-        if shutil.which(agent.detect_cmd[0]):
-            try:
-                result = subprocess.run(
-                    agent.detect_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    version = result.stdout.strip().split("\n")[0]
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                pass
+    # Check by command (only launched if the binary is on PATH)
+    if agent.detect_cmd and _which(agent.detect_cmd[0]):
+        version = _probe_version(agent.detect_cmd)
     
-    # Check by path existence
-    if agent.detect_path and agent.detect_path.exists():
-        version = version or "detected"
+    # Check by path existence, unless the command already answered
+    if version is None and agent.detect_path and agent.detect_path.exists():
+        version = "detected"
     
-    if version:
-        return {
-            "name": agent.name,
-            "display_name": agent.display_name,
-            "version": version,
-            "skills_path": str(agent.skills_path),
-            "local_skills_dir": agent.local_skills_dir,
-            "builtin_install": agent.builtin_install,
-        }
-    return None
+    if version is None:
+        return None
+    return {
+        "name": agent.name,
+        "display_name": agent.display_name,
+        "version": version,
+        "skills_path": str(agent.skills_path),
+        "local_skills_dir": agent.local_skills_dir,
+        "builtin_install": " ".join(agent.builtin_install_parts) if agent.builtin_install_parts else None,
+        "builtin_install_parts": agent.builtin_install_parts,
+        "builtin_uninstall_parts": agent.builtin_uninstall_parts,
+    }
 
 
 def detect_all() -> list[dict]:
-    """Detect all installed agents."""
-    detected = []
-    for agent in AGENTS:
-        result = detect_agent(agent)
-        if result:
-            detected.append(result)
-    return detected
+    """Detect all installed agents (probed concurrently, returned in registry order)."""
+    # Probes are dominated by waiting on `--version` subprocesses, so threads
+    # bring the total down to roughly the slowest single probe
+    with ThreadPoolExecutor(max_workers=len(AGENTS)) as pool:
+        results = list(pool.map(detect_agent, AGENTS))
+    return [r for r in results if r]
+
+
+def cache_dir() -> Path:
+    """Return the skill-manager cache directory ($XDG_CACHE_HOME/skill-manager)."""
+    base = os.environ.get("XDG_CACHE_HOME") or _HOME / ".cache"
+    return Path(base) / "skill-manager"
+
+
+# Bump when the shape of detect_agent()'s dict changes, to drop stale caches
+_CACHE_VERSION = "2"
+
+
+def _cache_key() -> str:
+    """Hash the environment that detection results depend on."""
+    env = "\0".join([_CACHE_VERSION, *(os.environ.get(k, "") for k in ("PATH", "HOME", "CODEX_HOME"))])
+    return hashlib.sha1(env.encode()).hexdigest()
+
+
+def cached_detect_all(ttl: float = 60, refresh: bool = False) -> list[dict]:
+    """
+    detect_all(), cached on disk for ttl seconds.
+    
+    Agent installs rarely change between invocations, so repeated CLI runs
+    reuse the previous result instead of launching every `--version` probe
+    again. The cache is ignored if PATH/HOME/CODEX_HOME changed, and
+    refresh=True forces a new detection.
+    """
+    cache_file = cache_dir() / "agents.json"
+    key = _cache_key()
+    
+    if not refresh:
+        try:
+            if cache_file.stat().st_mtime > time.time() - ttl:
+                cached = json.loads(cache_file.read_text())
+                if cached.get("key") == key:
+                    return cached["agents"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+    
+    agents = detect_all()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"key": key, "agents": agents}))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+    return agents
 
 
 def main(argv: list[str]) -> int:
@@ -125,17 +196,18 @@ def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(description="Detect installed AI agents")
     parser.add_argument("--format", choices=["text", "json"], default="text")
     parser.add_argument("--agent", help="Check specific agent only")
+    parser.add_argument("--no-cache", action="store_true", help="Re-detect agents instead of using the cache")
     args = parser.parse_args(argv)
     
     if args.agent:
-        agent = next((a for a in AGENTS if a.name == args.agent), None)
+        agent = AGENTS_BY_NAME.get(args.agent)
         if not agent:
             print(f"Unknown agent: {args.agent}", file=sys.stderr)
             return 1
         result = detect_agent(agent)
         agents = [result] if result else []
     else:
-        agents = detect_all()
+        agents = cached_detect_all(refresh=args.no_cache)
     
     if args.format == "json":
         print(json.dumps(agents, indent=2))
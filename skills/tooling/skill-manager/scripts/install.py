@@ -6,23 +6,28 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import queue
+import re
 import shutil
 import subprocess
 import sys
-import tempfile
-import urllib.error
-import urllib.parse
-import urllib.request
-import zipfile
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+if TYPE_CHECKING:
+    # Imported lazily where used; only annotations need them at module scope
+    import tempfile
+    import urllib.request
 
 # Import agent detection
-from detect_agents import AGENTS, detect_all
+from detect_agents import cache_dir, cached_detect_all
 
 
-@dataclass
-class Source:
+class Source(NamedTuple):
     """Parsed skill source."""
     owner: str
     repo: str
@@ -38,6 +43,8 @@ class InstallError(Exception):
 
 def parse_github_url(url: str, default_ref: str = "main") -> Source:
     """Parse a GitHub URL into components."""
+    import urllib.parse
+    
     parsed = urllib.parse.urlparse(url)
     if parsed.netloc not in ("github.com", "www.github.com"):
         raise InstallError("Only GitHub URLs are supported.")
@@ -90,111 +97,488 @@ def parse_shorthand(shorthand: str, default_ref: str = "main") -> Source:
     )
 
 
-def github_request(url: str) -> bytes:
-    """Make a GitHub API request."""
+def _github_headers() -> dict[str, str]:
+    """Headers for GitHub requests: User-Agent and optional token auth."""
     headers = {"User-Agent": "skill-manager"}
     token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
     if token:
         headers["Authorization"] = f"token {token}"
+    return headers
+
+
+@lru_cache(maxsize=1)
+def _opener() -> urllib.request.OpenerDirector:
+    """Shared urllib opener (honors HTTP(S)_PROXY / NO_PROXY, follows redirects)."""
+    import urllib.request
+    
+    return urllib.request.build_opener()
+
+
+# ETags of cached response bodies, persisted in <cache_dir>/http.json. Bodies
+# live in <cache_dir>/http/, pruned least-recently-used past _HTTP_CACHE_MAX.
+# Only anonymous responses are cached; with a token set nothing hits the disk.
+_HTTP_CACHE_MAX = 256 * 1024 * 1024
+_etags: dict[str, str] | None = None
+_etags_lock = threading.Lock()
+
+
+def _etag_index() -> dict[str, str]:
+    """Load the URL -> ETag index once per process (caller holds _etags_lock)."""
+    global _etags
+    if _etags is None:
+        try:
+            _etags = json.loads((cache_dir() / "http.json").read_text())
+        except (OSError, ValueError):
+            _etags = {}
+    return _etags
+
+
+def _save_etag_index(index: dict[str, str]) -> None:
+    """Persist the ETag index (caller holds _etags_lock)."""
+    try:
+        index_file = cache_dir() / "http.json"
+        tmp_index = index_file.with_name(f"http.json.{os.getpid()}.tmp")
+        tmp_index.write_text(json.dumps(index))
+        os.replace(tmp_index, index_file)
+    except OSError:
+        pass  # Revalidation is best-effort
+
+
+def _prune_http_cache(body_dir: Path, keep: Path) -> None:
+    """Delete the oldest cached bodies until the cache fits _HTTP_CACHE_MAX."""
+    import hashlib
+    
+    try:
+        bodies = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in os.scandir(body_dir) if e.is_file()]
+    except OSError:
+        return
+    total = sum(size for _, size, _ in bodies)
+    if total <= _HTTP_CACHE_MAX:
+        return
+    
+    removed = set()
+    for _, size, path in sorted(bodies):
+        if total <= _HTTP_CACHE_MAX:
+            break
+        if path == str(keep):
+            continue
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed.add(os.path.basename(path))
+    
+    index = _etag_index()
+    for url in [u for u in index if hashlib.sha1(u.encode()).hexdigest() in removed]:
+        del index[url]
+
+
+def _conditional_get(url: str, cancel: threading.Event | None = None) -> Path:
+    """
+    GET url to a file and return its path.
+    
+    Anonymous responses go to the on-disk HTTP cache: a previously seen ETag
+    is sent as If-None-Match, and on 304 Not Modified the cached body is
+    reused without transferring it again. Authenticated responses are written
+    to a scratch file instead, as are cancellable transfers, which a race
+    may abandon mid-body. Transport errors, including a connection dropped
+    mid-body, are raised as InstallError. Setting cancel stops a transfer at
+    the next chunk.
+    """
+    import hashlib
+    import http.client
+    import urllib.error
+    import urllib.request
+    
+    headers = _github_headers()
+    cached = "Authorization" not in headers and cancel is None
+    body_dir = cache_dir() / "http"
+    if cached:
+        try:
+            body_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            cached = False  # Cache not writable; still download
+    if not cached:
+        body_dir = _new_work_dir()
+    body = body_dir / hashlib.sha1(url.encode()).hexdigest()
+    
+    if cached:
+        with _etags_lock:
+            etag = _etag_index().get(url)
+        if etag and body.exists():
+            headers["If-None-Match"] = etag
     
-    req = urllib.request.Request(url, headers=headers)
+    tmp = body.with_name(f"{body.name}.{threading.get_ident()}.tmp")
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return resp.read()
+        with _opener().open(urllib.request.Request(url, headers=headers), timeout=30) as resp:
+            with open(tmp, "wb") as f:
+                while chunk := resp.read(1 << 16):
+                    if cancel is not None and cancel.is_set():
+                        raise InstallError(f"Download cancelled: {url}")
+                    f.write(chunk)
+            # read(amt) returns b"" on an early close instead of raising
+            if resp.length:
+                raise http.client.IncompleteRead(b"", resp.length)
+            new_etag = resp.headers.get("ETag")
+        os.replace(tmp, body)
     except urllib.error.HTTPError as e:
+        if e.code == 304 and "If-None-Match" in headers:
+            os.utime(body)  # Mark as recently used for pruning
+            return body
         raise InstallError(f"HTTP {e.code}: {e.reason}") from e
+    except (http.client.HTTPException, urllib.error.URLError) as e:
+        raise InstallError(f"Download failed: {url}: {e}") from e
+    finally:
+        tmp.unlink(missing_ok=True)
+    
+    if cached:
+        with _etags_lock:
+            index = _etag_index()
+            if new_etag:
+                index[url] = new_etag
+            else:
+                index.pop(url, None)
+            _prune_http_cache(body_dir, keep=body)
+            _save_etag_index(index)
+    return body
+
+
+def github_request(url: str) -> bytes:
+    """Make a GitHub API request."""
+    return _conditional_get(url).read_bytes()
+
 
+def github_stream(url: str, dest: Path) -> None:
+    """Download url to dest without buffering the body in memory."""
+    _clone_file(str(_conditional_get(url)), str(dest))
 
-def install_builtin(source: Source, agent_cmd: str) -> bool:
+
+def github_download(url: str, cancel: threading.Event | None = None) -> Path:
+    """Download url into the HTTP cache and return the cached file to read in place."""
+    return _conditional_get(url, cancel)
+
+
+_builtin_locks: dict[str, threading.Lock] = {}
+_builtin_locks_guard = threading.Lock()
+
+
+def _builtin_lock(binary: str) -> threading.Lock:
+    """Return the lock serializing built-in installs through one agent binary."""
+    with _builtin_locks_guard:
+        return _builtin_locks.setdefault(binary, threading.Lock())
+
+
+def install_builtin(source: Source, cmd_parts: Sequence[str]) -> bool:
     """Try to install using agent's built-in command."""
-    cmd_parts = agent_cmd.split()
     skill_ref = f"{source.owner}/{source.repo}"
     if source.path:
         skill_ref += f"/{source.path}"
     
     cmd = [*cmd_parts, skill_ref]
+    # Agents install concurrently; don't assume a CLI tolerates parallel runs
+    with _builtin_lock(cmd_parts[0]):
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return False
+
+
+# Clones and zip extractions are shared by all agents in one run, so the repo
+# is fetched once rather than once per agent. Failures (None) are memoized too.
+# Each key has its own lock so different kinds of fetch can run concurrently.
+_fetch_cache: dict[tuple[str, str, str, str, str], Path | None] = {}
+_fetch_locks: dict[tuple[str, str, str, str, str], threading.Lock] = {}
+_fetch_lock = threading.Lock()
+_work_dir: tempfile.TemporaryDirectory | None = None
+
+
+def _new_work_dir() -> Path:
+    """Create a scratch dir under a process-lifetime temp dir (removed at exit)."""
+    import tempfile
+    
+    global _work_dir
+    with _fetch_lock:
+        if _work_dir is None:
+            # A race loser may still be writing here when the process exits
+            _work_dir = tempfile.TemporaryDirectory(prefix="skill-manager-", ignore_cleanup_errors=True)
+    return Path(tempfile.mkdtemp(dir=_work_dir.name))
+
+
+def _memoized_fetch(kind: str, source: Source, fetch) -> Path | None:
+    """Run fetch(source) once per (kind, owner, repo, ref, path) and share the result."""
+    key = (kind, source.owner, source.repo, source.ref, source.path)
+    with _fetch_lock:
+        key_lock = _fetch_locks.setdefault(key, threading.Lock())
+    with key_lock:
+        if key not in _fetch_cache:
+            _fetch_cache[key] = fetch(source)
+        return _fetch_cache[key]
+
+
+def _clone_file(src: str, dst: str) -> str:
+    """
+    copytree copy_function that lets the kernel copy file data.
+    
+    os.copy_file_range copies without a round trip through user space and
+    shares extents (reflinks) on filesystems that support it, such as btrfs
+    and XFS. Falls back to shutil.copy2 where it is unavailable or refused
+    (e.g. across filesystems on older kernels).
+    """
+    if hasattr(os, "copy_file_range") and not os.path.islink(src):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _copy_from(root: Path, source: Source, dest: Path) -> bool:
+    """Copy the skill directory of source out of a fetched repo tree."""
+    src_path = root / source.path if source.path else root
+    if not src_path.exists():
+        return False
+    
+    dest.mkdir(parents=True, exist_ok=True)
+    shutil.copytree(src_path, dest, copy_function=_clone_file, dirs_exist_ok=True)
+    return True
+
+
+def _fetch_api_tree(source: Source) -> Path | None:
+    """
+    Download only source.path's files using the git trees API and raw URLs.
+    
+    One API call lists the tree; the blobs under source.path are then fetched
+    concurrently from raw.githubusercontent.com. Returns a directory laid out
+    like the repo root, or None if the tree is unavailable, truncated, or
+    contains symlinks (raw URLs serve a link as a file holding its target).
+    """
+    import urllib.parse
+    
+    ref = urllib.parse.quote(source.ref, safe="")
+    tree_url = f"https://api.github.com/repos/{source.owner}/{source.repo}/git/trees/{ref}?recursive=1"
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+        tree = json.loads(github_request(tree_url))
+    except (InstallError, OSError, ValueError):
+        return None
+    if tree.get("truncated"):
+        return None  # Listing is incomplete; let git/download handle it
+    
+    prefix = f"{source.path.rstrip('/')}/" if source.path else ""
+    blobs = [
+        entry for entry in tree.get("tree", [])
+        if entry.get("type") == "blob" and entry["path"].startswith(prefix)
+    ]
+    if not blobs or any(entry.get("mode") == "120000" for entry in blobs):
+        return None
+    
+    root = _new_work_dir()
+    
+    def fetch(entry: dict) -> None:
+        target = root / entry["path"]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        raw_url = (
+            f"https://raw.githubusercontent.com/{source.owner}/{source.repo}/"
+            f"{ref}/{urllib.parse.quote(entry['path'])}"
+        )
+        github_stream(raw_url, target)
+        if entry.get("mode") == "100755":
+            target.chmod(0o755)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(fetch, blobs))
+    except (InstallError, OSError):
+        return None
+    return root
+
+
+def install_api(source: Source, dest: Path) -> bool:
+    """Install by fetching just the skill's files through the GitHub API."""
+    root = _memoized_fetch("api", source, _fetch_api_tree)
+    if root is None:
         return False
+    return _copy_from(root, source, dest)
+
+
+@lru_cache(maxsize=32)
+def _which(cmd: str) -> str | None:
+    """shutil.which(), memoized for the life of the process."""
+    return shutil.which(cmd)
+
+
+@lru_cache(maxsize=1)
+def _git_version() -> tuple[int, ...]:
+    """Return the installed git version, e.g. (2, 39, 5); () if unknown."""
+    try:
+        out = subprocess.run(["git", "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return ()
+    match = re.search(r"(\d+)\.(\d+)(?:\.(\d+))?", out)
+    return tuple(int(n) for n in match.groups(default="0")) if match else ()
+
+
+def _run_git(cmd: list[str], timeout: float | None = None, cancel: threading.Event | None = None) -> None:
+    """subprocess.run(cmd, check=True) for git that also kills it once cancel is set."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) as proc:
+        while True:
+            try:
+                proc.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel is not None and cancel.is_set():
+                    proc.kill()
+                elif deadline is not None and time.monotonic() > deadline:
+                    proc.kill()
+                    raise subprocess.TimeoutExpired(cmd, timeout) from None
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def _clone_sparse(source: Source, cancel: threading.Event | None = None) -> Path | None:
+    """Shallow, sparse clone of source's repo; returns the checkout dir."""
+    repo_dir = _new_work_dir() / "repo"
+    repo_url = f"https://github.com/{source.owner}/{source.repo}.git"
+    git = ["git", "-C", str(repo_dir)]
+    # Cone-mode sparse-checkout needs git 2.25+; older gits get a plain shallow clone
+    sparse = bool(source.path) and _git_version() >= (2, 25)
+    
+    # Clone without checking anything out, so only the sparse subtree is
+    # ever written (and, with blob:none, fetched)
+    clone_cmd = [
+        "git", "clone",
+        *(["--no-checkout", "--filter=blob:none"] if sparse else []),
+        "--depth", "1",
+        "--single-branch",
+        "--branch", source.ref,
+        repo_url,
+        str(repo_dir),
+    ]
+    
+    try:
+        _run_git(clone_cmd, timeout=60, cancel=cancel)
+        
+        if sparse:
+            # Narrow to our path, then materialize just that subtree
+            _run_git([*git, "sparse-checkout", "init", "--cone"], cancel=cancel)
+            _run_git([*git, "sparse-checkout", "set", source.path], cancel=cancel)
+            _run_git([*git, "checkout", source.ref], timeout=60, cancel=cancel)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+        shutil.rmtree(repo_dir.parent, ignore_errors=True)
+        return None
+    
+    return repo_dir
 
 
 def install_git_sparse(source: Source, dest: Path) -> bool:
     """Install using git sparse-checkout."""
-    if not shutil.which("git"):
+    if not _which("git"):
         return False
     
-    with tempfile.TemporaryDirectory() as tmp:
-        repo_dir = Path(tmp) / "repo"
-        repo_url = f"https://github.com/{source.owner}/{source.repo}.git"
-        
-        # Clone with sparse checkout
-        clone_cmd = [
-            "git", "clone",
-            "--filter=blob:none",
-            "--depth", "1",
-            "--sparse",
-            "--single-branch",
-            "--branch", source.ref,
-            repo_url,
-            str(repo_dir),
-        ]
-        
-        try:
-            subprocess.run(clone_cmd, capture_output=True, check=True, timeout=60)
-        except subprocess.CalledProcessError:
-            return False
-        
-        # Set sparse-checkout to only include our path
-        if source.path:
-            sparse_cmd = ["git", "-C", str(repo_dir), "sparse-checkout", "set", source.path]
-            subprocess.run(sparse_cmd, capture_output=True, check=True)
-        
-        # Copy skill files to destination
-        src_path = repo_dir / source.path if source.path else repo_dir
-        if not src_path.exists():
-            return False
-        
-        dest.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(src_path, dest, dirs_exist_ok=True)
-        
-        # Remove .git if copied
-        git_dir = dest / ".git"
-        if git_dir.exists():
-            shutil.rmtree(git_dir)
-        
-        return True
+    repo_dir = _memoized_fetch("git", source, _clone_sparse)
+    if repo_dir is None or not _copy_from(repo_dir, source, dest):
+        return False
+    
+    # Remove .git if copied
+    git_dir = dest / ".git"
+    if git_dir.exists():
+        shutil.rmtree(git_dir)
+    
+    return True
 
 
-def install_download(source: Source, dest: Path) -> bool:
-    """Install by downloading repo zip."""
+def _fetch_and_extract(source: Source, cancel: threading.Event | None = None) -> Path | None:
+    """Download source's repo zip and extract source.path; returns the repo root."""
+    import zipfile
+    
     zip_url = f"https://codeload.github.com/{source.owner}/{source.repo}/zip/{source.ref}"
     
     try:
-        payload = github_request(zip_url)
-    except InstallError:
-        return False
+        zip_path = github_download(zip_url, cancel)
+    except (InstallError, OSError):
+        return None
     
-    with tempfile.TemporaryDirectory() as tmp:
-        zip_path = Path(tmp) / "repo.zip"
-        zip_path.write_bytes(payload)
-        
+    # Read the cached zip in place; only the skill's files are written out
+    tmp = _new_work_dir()
+    try:
         with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(tmp)
-        
-        # Find extracted directory (usually repo-ref)
-        extracted = next(Path(tmp).glob(f"{source.repo}-*"), None)
-        if not extracted:
-            return False
-        
-        src_path = extracted / source.path if source.path else extracted
-        if not src_path.exists():
-            return False
-        
-        dest.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(src_path, dest, dirs_exist_ok=True)
-        return True
+            members = zf.infolist()
+            if not members:
+                return None
+            # Archive root is "<repo>-<ref or sha>/"; only extract the skill's subtree
+            top = members[0].filename.split("/", 1)[0]
+            prefix = f"{top}/{source.path.strip('/')}/" if source.path else f"{top}/"
+            for info in members:
+                if info.filename.startswith(prefix):
+                    zf.extract(info, tmp)
+    except (zipfile.BadZipFile, OSError):
+        return None
+    
+    return tmp / top
+
+
+def install_download(source: Source, dest: Path) -> bool:
+    """Install by downloading repo zip."""
+    extracted = _memoized_fetch("zip", source, _fetch_and_extract)
+    if extracted is None:
+        return False
+    return _copy_from(extracted, source, dest)
+
+
+def install_race(source: Source, dest: Path) -> str | None:
+    """
+    Fetch source with git and the zip download concurrently; first one wins.
+    
+    Each fetch writes to its own scratch dir, so the winner is copied to
+    dest. The loser is not waited for: its clone is killed or its download
+    cancelled, and it runs on a daemon thread so a transfer still stuck in
+    connect or waiting for headers can't hold up exit. Returns the winning
+    method, or None.
+    """
+    cancel = threading.Event()
+    fetches = {"download": ("zip", partial(_fetch_and_extract, cancel=cancel))}
+    if _which("git"):
+        fetches["git"] = ("git", partial(_clone_sparse, cancel=cancel))
+    
+    results: queue.Queue[tuple[str, Path | None]] = queue.Queue()
+    
+    def run(method: str, kind: str, fetch) -> None:
+        try:
+            results.put((method, _memoized_fetch(kind, source, fetch)))
+        except Exception:
+            results.put((method, None))
+    
+    for method, (kind, fetch) in fetches.items():
+        threading.Thread(target=run, args=(method, kind, fetch), daemon=True).start()
+    
+    winner = root = None
+    try:
+        for _ in fetches:
+            method, root = results.get()
+            if root is not None:
+                winner = method
+                break
+    finally:
+        cancel.set()
+    
+    if winner is None or not _copy_from(root, source, dest):
+        return None
+    
+    git_dir = dest / ".git"
+    if git_dir.exists():
+        shutil.rmtree(git_dir)
+    return winner
 
 
 def install_local(local_path: Path, dest: Path, symlink: bool = False) -> bool:
@@ -210,17 +594,112 @@ def install_local(local_path: Path, dest: Path, symlink: bool = False) -> bool:
         dest.symlink_to(local_path.resolve())
     else:
         dest.mkdir(parents=True, exist_ok=True)
-        shutil.copytree(local_path, dest, dirs_exist_ok=True)
+        shutil.copytree(local_path, dest, copy_function=_clone_file, dirs_exist_ok=True)
     
     return True
 
 
+def _publish(staging: Path, dest: Path) -> None:
+    """Move a fully copied skill dir into place with a single rename."""
+    if dest.is_symlink():
+        dest.unlink()
+    elif dest.exists():
+        shutil.rmtree(dest)
+    os.rename(staging, dest)
+
+
+def _install_to_agent(
+    name: str,
+    agent: dict,
+    local: bool,
+    local_path: Path,
+    source: Source | None,
+    symlink: bool,
+    method: str,
+    skill_name: str,
+) -> tuple[str, dict]:
+    """Install a skill for one agent; returns (results key, record)."""
+    # Use project-local path if --local flag is set
+    if local:
+        base = Path.cwd() / agent.get("local_skills_dir", f".{name}/skills")
+        dest = base / skill_name
+    else:
+        dest = Path(agent["skills_path"]) / skill_name
+    
+    if dest.exists() and not symlink:
+        return "skipped", {
+            "agent": name,
+            "reason": "Already exists",
+            "path": str(dest),
+        }
+    
+    success = False
+    method_used = None
+    
+    # Copies are built in a hidden sibling dir and renamed into place, so an
+    # interrupted install never leaves a half-populated dest behind
+    staging = dest.parent / f".{dest.name}.tmp-{os.getpid()}"
+    try:
+        # Local install (a symlink is created in one step, no staging needed)
+        if local_path.exists():
+            success = install_local(local_path, dest if symlink else staging, symlink)
+            method_used = "symlink" if symlink else "copy"
+        
+        # GitHub install
+        elif source:
+            # Try built-in first
+            if method in ("auto", "builtin") and agent.get("builtin_install_parts"):
+                success = install_builtin(source, agent["builtin_install_parts"])
+                if success:
+                    method_used = "builtin"
+            
+            # Try git sparse-checkout
+            if not success and method in ("auto", "git"):
+                success = install_git_sparse(source, staging)
+                if success:
+                    method_used = "git"
+            
+            # Try fetching only the skill's files via the API
+            if not success and method in ("auto", "api"):
+                success = install_api(source, staging)
+                if success:
+                    method_used = "api"
+            
+            # Try download
+            if not success and method in ("auto", "download"):
+                success = install_download(source, staging)
+                if success:
+                    method_used = "download"
+            
+            # Race git against download
+            if method == "race":
+                method_used = install_race(source, staging)
+                success = method_used is not None
+        
+        if success and staging.exists():
+            _publish(staging, dest)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    
+    if success:
+        return "installed", {
+            "agent": name,
+            "path": str(dest),
+            "method": method_used,
+        }
+    return "failed", {
+        "agent": name,
+        "path": str(dest),
+    }
+
+
 def install_skill(
     source_str: str,
     agents: list[str] | None = None,
     symlink: bool = False,
     method: str = "auto",
     local: bool = False,
+    use_cache: bool = True,
 ) -> dict:
     """Install a skill to specified agents."""
     results = {"installed": [], "failed": [], "skipped": []}
@@ -238,75 +717,29 @@ def install_skill(
         skill_name = source.skill_name
     
     # Detect agents
-    detected = {a["name"]: a for a in detect_all()}
+    detected = {a["name"]: a for a in cached_detect_all(refresh=not use_cache)}
     
     if not detected:
         raise InstallError("No AI agents detected on this system.")
     
     # Filter to requested agents
     if agents and agents != ["all"]:
-        target_agents = {k: v for k, v in detected.items() if k in agents}
+        agent_set = frozenset(agents)
+        target_agents = {k: v for k, v in detected.items() if k in agent_set}
         if not target_agents:
             raise InstallError(f"None of the specified agents found: {agents}")
     else:
         target_agents = detected
     
-    # Install to each agent
-    for name, agent in target_agents.items():
-        # Use project-local path if --local flag is set
-        if local:
-            base = Path.cwd() / agent.get("local_skills_dir", f".{name}/skills")
-            dest = base / skill_name
-        else:
-            dest = Path(agent["skills_path"]) / skill_name
-        
-        if dest.exists() and not symlink:
-            results["skipped"].append({
-                "agent": name,
-                "reason": "Already exists",
-                "path": str(dest),
-            })
-            continue
-        
-        success = False
-        method_used = None
-        
-        # Local install
-        if local_path.exists():
-            success = install_local(local_path, dest, symlink)
-            method_used = "symlink" if symlink else "copy"
-        
-        # GitHub install
-        elif source:
-            # Try built-in first
-            if method in ("auto", "builtin") and agent.get("builtin_install"):
-                success = install_builtin(source, agent["builtin_install"])
-                if success:
-                    method_used = "builtin"
-            
-            # Try git sparse-checkout
-            if not success and method in ("auto", "git"):
-                success = install_git_sparse(source, dest)
-                if success:
-                    method_used = "git"
-            
-            # Try download
-            if not success and method in ("auto", "download"):
-                success = install_download(source, dest)
-                if success:
-                    method_used = "download"
-        
-        if success:
-            results["installed"].append({
-                "agent": name,
-                "path": str(dest),
-                "method": method_used,
-            })
-        else:
-            results["failed"].append({
-                "agent": name,
-                "path": str(dest),
-            })
+    # Install to each agent concurrently; installs are network/disk bound
+    # and target independent directories
+    def install_one(item: tuple[str, dict]) -> tuple[str, dict]:
+        name, agent = item
+        return _install_to_agent(name, agent, local, local_path, source, symlink, method, skill_name)
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(target_agents))) as pool:
+        for status, record in pool.map(install_one, target_agents.items()):
+            results[status].append(record)
     
     return results
 
@@ -318,14 +751,18 @@ def main(argv: list[str]) -> int:
     parser.add_argument("--agents", help="Comma-separated agents or 'all'", default="all")
     parser.add_argument("--symlink", action="store_true", help="Create symlinks")
     parser.add_argument("--local", action="store_true", help="Install to project-local skills dir")
-    parser.add_argument("--method", choices=["auto", "builtin", "git", "download"], default="auto")
+    parser.add_argument("--method", choices=["auto", "builtin", "api", "git", "download", "race"], default="auto")
     parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument("--no-cache", action="store_true", help="Re-detect agents instead of using the cache")
     args = parser.parse_args(argv)
     
     agents = args.agents.split(",") if args.agents != "all" else ["all"]
     
     try:
-        results = install_skill(args.source, agents, args.symlink, args.method, args.local)
+        results = install_skill(
+            args.source, agents, args.symlink, args.method, args.local,
+            use_cache=not args.no_cache,
+        )
     except InstallError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -5,32 +5,44 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
-from pathlib import Path
 
-from detect_agents import detect_all
+from detect_agents import cached_detect_all
 
 
-def list_skills(agent_filter: str | None = None) -> dict:
+def list_skills(agent_filter: str | None = None, use_cache: bool = True) -> dict:
     """List installed skills for all or specific agents."""
-    detected = detect_all()
+    detected = cached_detect_all(refresh=not use_cache)
     
     if agent_filter:
         detected = [a for a in detected if a["name"] == agent_filter]
     
     results = {}
     for agent in detected:
-        skills_path = Path(agent["skills_path"])
         skills = []
         
-        if skills_path.exists():
-            for skill_dir in skills_path.iterdir():
-                if skill_dir.is_dir() and (skill_dir / "SKILL.md").exists():
+        try:
+            with os.scandir(agent["skills_path"]) as it:
+                for entry in it:
+                    # d_type answers both checks without a syscall. Symlinks
+                    # (`--symlink` installs) aren't stat'ed separately: the
+                    # SKILL.md stat below follows the link and fails with
+                    # ENOTDIR unless it points at a directory.
+                    # Hidden entries include in-progress (or interrupted) installs
+                    if entry.name.startswith("."):
+                        continue
+                    if not entry.is_symlink() and not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if not os.path.exists(os.path.join(entry.path, "SKILL.md")):
+                        continue
                     skills.append({
-                        "name": skill_dir.name,
-                        "path": str(skill_dir),
-                        "symlink": skill_dir.is_symlink(),
+                        "name": entry.name,
+                        "path": entry.path,
+                        "symlink": entry.is_symlink(),
                     })
+        except (FileNotFoundError, NotADirectoryError):
+            pass
         
         results[agent["name"]] = {
             "display_name": agent["display_name"],
@@ -46,9 +58,10 @@ def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(description="List installed skills")
     parser.add_argument("--agent", help="Filter to specific agent")
     parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument("--no-cache", action="store_true", help="Re-detect agents instead of using the cache")
     args = parser.parse_args(argv)
     
-    results = list_skills(args.agent)
+    results = list_skills(args.agent, use_cache=not args.no_cache)
     
     if args.format == "json":
         print(json.dumps(results, indent=2))
@@ -10,18 +10,15 @@ import subprocess
 import sys
 from pathlib import Path
 
-from detect_agents import detect_all
+from detect_agents import cached_detect_all
 
 
 def uninstall_builtin(skill_name: str, agent: dict) -> bool:
     """Try to uninstall using agent's built-in command."""
-    if not agent.get("builtin_install"):
+    if not agent.get("builtin_uninstall_parts"):
         return False
     
-    # Derive uninstall command from install command
-    # "claude skill install" -> "claude skill remove"
-    cmd_parts = agent["builtin_install"].replace("install", "remove").split()
-    cmd = [*cmd_parts, skill_name]
+    cmd = [*agent["builtin_uninstall_parts"], skill_name]
     
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
@@ -33,18 +30,20 @@ def uninstall_builtin(skill_name: str, agent: dict) -> bool:
 def uninstall_skill(
     skill_name: str,
     agents: list[str] | None = None,
+    use_cache: bool = True,
 ) -> dict:
     """Uninstall a skill from specified agents."""
     results = {"removed": [], "not_found": []}
     
-    detected = {a["name"]: a for a in detect_all()}
+    detected = {a["name"]: a for a in cached_detect_all(refresh=not use_cache)}
     
     if not detected:
         return results
     
     # Filter to requested agents
     if agents and agents != ["all"]:
-        target_agents = {k: v for k, v in detected.items() if k in agents}
+        agent_set = frozenset(agents)
+        target_agents = {k: v for k, v in detected.items() if k in agent_set}
     else:
         target_agents = detected
     
@@ -54,7 +53,7 @@ def uninstall_skill(
         method = None
         
         # Try built-in uninstall first
-        if agent.get("builtin_install"):
+        if agent.get("builtin_uninstall_parts"):
             if uninstall_builtin(skill_name, agent):
                 removed = True
                 method = "builtin"
@@ -89,10 +88,11 @@ def main(argv: list[str]) -> int:
     parser.add_argument("skill_name", help="Name of skill to uninstall")
     parser.add_argument("--agents", help="Comma-separated agents or 'all'", default="all")
     parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument("--no-cache", action="store_true", help="Re-detect agents instead of using the cache")
     args = parser.parse_args(argv)
     
     agents = args.agents.split(",") if args.agents != "all" else ["all"]
-    results = uninstall_skill(args.skill_name, agents)
+    results = uninstall_skill(args.skill_name, agents, use_cache=not args.no_cache)
     
     if args.format == "json":
         print(json.dumps(results, indent=2))